@@ -3,7 +3,7 @@ from PyQt5.QtWidgets import (
 )
 import os
 from PyQt5.QtCore import Qt
-from UI_Interface.image_palette_items import DraggableImageLabel
+from UI_Interface.image_palette_items import DraggableImageLabel, load_icon_pixmap
 
 SCROLLBAR_STYLE = """
     QScrollBar:vertical {
@@ -50,13 +50,65 @@ SCROLLBAR_STYLE = """
 """
 
 
+# Palette icon label size and border, in pixels
+ICON_SIZE = int(60 * 0.80)
+ICON_BORDER_WIDTH = 2
+
+# File extensions (lower-case, without the dot) picked up as palette icons
+IMAGE_EXTENSIONS = frozenset(('png', 'jpg', 'jpeg'))
+
+
+PALETTE_QSS = f"""
+    QPushButton#paletteToggle {{
+        background-color: #e0e0e0;
+        color: #111;
+        border: 1.5px solid;
+        border-radius: 8px;
+        padding: 12px 24px;
+        font-size: 15px;
+        font-weight: 600;
+        letter-spacing: 1px;
+        margin-left: 1px;
+        margin-right: 1px;
+        margin-top: 6px;
+    }}
+    QPushButton#paletteToggle:hover {{
+        background-color: #cccccc;
+        color: #111;
+        border: 1.5px solid #9e9e9e;
+    }}
+    QPushButton#paletteToggle:pressed, QPushButton#paletteToggle:checked {{
+        background-color: #757575;
+        color: #fff;
+        border: 1.5px solid #616161;
+    }}
+    QWidget#paletteSection {{
+        background: #e0e0e0;
+        border-radius: 8px;
+    }}
+    QWidget#paletteCell {{
+        background: transparent;
+    }}
+    QLabel#paletteIcon {{
+        border: {ICON_BORDER_WIDTH}px solid;
+        border-radius: 0px;
+        background: white;
+    }}
+    QLabel#paletteCaption {{
+        font-size: 11px;
+        color: #333;
+        background: transparent;
+    }}
+"""
+
+
 class DraggableIconPalette(QFrame):
     """
     Single public palette class that builds collapsible "sections" internally.
 
     What it does:
         - Provides a scrollable list of collapsible category widgets.
-        - Each category contains a grid of draggable image icons.
+        - Each category contains a grid of draggable image icons, built the first time it is expanded.
         - Scans the Image_Icons directory for categories and builds UI dynamically.
 
     Design:
@@ -67,66 +119,72 @@ class DraggableIconPalette(QFrame):
         super().__init__(parent)
         self.setup_ui()
 
-    def collapsible_section_icons(self, title, image_paths, num_columns=4, font_weight="bold"):
-        
+    def collapsible_section_icons(self, title, image_paths, num_columns=4):
+
         toggle_button = QPushButton(title)
         toggle_button.setCheckable(True)
         toggle_button.setChecked(False)
-        toggle_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #e0e0e0;
-                color: #111;
-                border: 1.5px solid;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-size: 15px;
-                font-weight: {font_weight};
-                letter-spacing: 1px;
-                margin-left: 1px;
-                margin-right: 1px;
-                margin-top: 6px;
-            }}
-            QPushButton:hover {{
-                background-color: #cccccc;
-                color: #111;
-                border: 1.5px solid #9e9e9e;
-            }}
-            QPushButton:pressed, QPushButton:checked {{
-                background-color: #757575;
-                color: #fff;
-                border: 1.5px solid #616161;
-            }}
-        """)
+        toggle_button.setObjectName("paletteToggle")
 
         content_widget = QWidget()
         content_layout = QGridLayout()
         content_layout.setAlignment(Qt.AlignTop)
         content_layout.setContentsMargins(16, 12, 16, 12)
-        content_layout.setSpacing(16)
+        content_layout.setSpacing(12)
         content_widget.setLayout(content_layout)
         content_widget.setVisible(False)
+        content_widget.setObjectName("paletteSection")
 
-        # Add images to the grid
-        image_width = int(60 * 0.80)
-        image_height = int(60 * 0.80)
+        # Reserve the section height up-front; the icons themselves are built on first expand
         num_images = len(image_paths)
         num_rows = (num_images + num_columns - 1) // num_columns
+        row_height = ICON_SIZE + 32
+        content_height = num_rows * row_height + 24
+        content_widget.setFixedHeight(content_height)
+
+        # Connect toggle behaviour
+        toggle_button.clicked.connect(
+            lambda checked, w=content_widget: self.toggle_section(w, image_paths, num_columns, checked)
+        )
+
+        wrapper = QWidget()
+        wrapper_layout = QVBoxLayout(wrapper)
+        wrapper_layout.setSpacing(0)
+        wrapper_layout.setContentsMargins(8, 0, 8, 12)
+        wrapper_layout.addWidget(toggle_button)
+        wrapper_layout.addWidget(content_widget)
+        return wrapper
+
+    def toggle_section(self, content_widget, image_paths, num_columns, checked):
+        """Show or hide a section, building its icons the first time it is expanded."""
+        if checked and not content_widget.property("built"):
+            self.populate_section_icons(content_widget, image_paths, num_columns)
+        content_widget.setVisible(checked)
+
+    def populate_section_icons(self, content_widget, image_paths, num_columns):
+        """Fill a section's grid with draggable icons and their captions."""
+        content_layout = content_widget.layout()
+
+        # Icons are scaled once to the area inside the label border and shared across sections
+        icon_width = ICON_SIZE - 2 * ICON_BORDER_WIDTH
+        icon_height = ICON_SIZE - 2 * ICON_BORDER_WIDTH
 
         for i, path in enumerate(image_paths):
             row = i // num_columns
             col = i % num_columns
 
-            icon_label = DraggableImageLabel(path)
-            icon_label.setFixedSize(image_width, image_height)
-            icon_label.setStyleSheet("border: 2px solid; border-radius: 0px; background: white;")
+            icon_pixmap = load_icon_pixmap(path, icon_width, icon_height)
+            icon_label = DraggableImageLabel(path, icon_pixmap)
+            icon_label.setFixedSize(ICON_SIZE, ICON_SIZE)
+            icon_label.setObjectName("paletteIcon")
 
             base_name = os.path.splitext(os.path.basename(path))[0]
             text_label = QLabel(base_name)
             text_label.setAlignment(Qt.AlignCenter)
-            text_label.setStyleSheet("font-size: 11px; color: #333;")
+            text_label.setObjectName("paletteCaption")
 
             icon_widget = QWidget()
-            icon_widget.setStyleSheet("background: transparent;")
+            icon_widget.setObjectName("paletteCell")
             v_layout = QVBoxLayout(icon_widget)
             v_layout.setContentsMargins(4, 4, 4, 4)
             v_layout.setSpacing(8)
@@ -135,23 +193,7 @@ class DraggableIconPalette(QFrame):
             v_layout.addWidget(text_label, alignment=Qt.AlignHCenter)
             content_layout.addWidget(icon_widget, row, col)
 
-        content_layout.setSpacing(12)
-        content_widget.setStyleSheet("background: #e0e0e0; border-radius: 8px;")
-
-        row_height = image_height + 32
-        content_height = num_rows * row_height + 24
-        content_widget.setFixedHeight(content_height)
-
-        # Connect toggle behaviour
-        toggle_button.clicked.connect(lambda checked, w=content_widget: w.setVisible(checked))
-
-        wrapper = QWidget()
-        wrapper_layout = QVBoxLayout(wrapper)
-        wrapper_layout.setSpacing(0)
-        wrapper_layout.setContentsMargins(8, 0, 8, 12)
-        wrapper_layout.addWidget(toggle_button)
-        wrapper_layout.addWidget(content_widget)
-        return wrapper
+        content_widget.setProperty("built", True)
 
     def setup_ui(self):
         """Set up the palette UI using internal helper to create sections."""
@@ -160,6 +202,8 @@ class DraggableIconPalette(QFrame):
         self.setStyleSheet("background-color: #f5f5f5; border-radius: 10px;")
 
         main_widget = QWidget()
+        # One stylesheet for every section, parsed once; widgets pick rules up by object name
+        main_widget.setStyleSheet(PALETTE_QSS)
         main_layout = QVBoxLayout(main_widget)
         main_layout.setAlignment(Qt.AlignTop)
         main_layout.setSpacing(1)
@@ -168,16 +212,19 @@ class DraggableIconPalette(QFrame):
         base_dir = os.path.dirname(__file__)
         image_icons_dir = os.path.abspath(os.path.join(base_dir, "..", "Image_Icons"))
 
-        for category in sorted(os.listdir(image_icons_dir)):
-            category_path = os.path.join(image_icons_dir, category)
-            if os.path.isdir(category_path):
+        # scandir entries carry the name and cached file type, avoiding a stat per entry
+        with os.scandir(image_icons_dir) as entries:
+            categories = sorted((e.name, e.path) for e in entries if e.is_dir())
+
+        for category, category_path in categories:
+            with os.scandir(category_path) as entries:
                 image_files = [
-                    os.path.join(category_path, f)
-                    for f in os.listdir(category_path)
-                    if f.lower().endswith(('.png', '.jpg', '.jpeg'))
+                    e.path
+                    for e in entries
+                    if e.name.rpartition('.')[2].lower() in IMAGE_EXTENSIONS
                 ]
-                collapsible_section_widgets = self.collapsible_section_icons(category, image_files, num_columns=2, font_weight="600")
-                main_layout.addWidget(collapsible_section_widgets)
+            collapsible_section_widgets = self.collapsible_section_icons(category, image_files, num_columns=2)
+            main_layout.addWidget(collapsible_section_widgets)
         main_layout.addStretch(1)
 
         scroll_area = QScrollArea(self)
@@ -1,8 +1,43 @@
 from PyQt5.QtWidgets import QLabel
-from PyQt5.QtCore import Qt, QPoint, QByteArray, QIODevice, QMimeData, QBuffer
-from PyQt5.QtGui import QPixmap, QDrag, QPainter, QPen, QColor
+from PyQt5.QtCore import Qt, QPoint, QByteArray, QIODevice, QMimeData, QBuffer, QSize
+from PyQt5.QtGui import QPixmap, QDrag, QPainter, QPen, QColor, QImageReader
 import os
 
+# Decoded icon pixmaps shared by every palette label, keyed by
+# (absolute path, file mtime, width, height) so an edited icon is reloaded.
+_pixmap_cache = {}
+
+
+def load_icon_pixmap(image_path, width, height):
+    """
+    Returns the icon at image_path scaled to fit width x height, decoding it only once.
+
+    What it does:
+        - Reuses the already-decoded QPixmap when the same icon is requested again.
+        - Reloads the icon automatically when the file on disk changes.
+
+    How:
+        - Builds a cache key from the absolute path, modification time and target size.
+        - On a miss, decodes the image straight to its target size with QImageReader.setScaledSize
+          (keeping aspect ratio), so no full-resolution intermediate is created, and stores it.
+    """
+    abs_path = os.path.abspath(image_path)
+    try:
+        mtime = os.stat(abs_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    key = (abs_path, mtime, width, height)
+
+    pixmap = _pixmap_cache.get(key)
+    if pixmap is None:
+        reader = QImageReader(abs_path)
+        source_size = reader.size()  # Read from the file header, no decoding yet
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(QSize(width, height), Qt.KeepAspectRatio))
+        pixmap = QPixmap.fromImage(reader.read())
+        _pixmap_cache[key] = pixmap
+    return pixmap
+
 
 class DraggableImageLabel(QLabel):
     """
@@ -17,7 +52,7 @@ class DraggableImageLabel(QLabel):
         - Implements mousePressEvent to start a drag operation with the image and its label.
         - Uses a helper to create a bordered pixmap for the drag preview.
     """
-    def __init__(self, image_path):
+    def __init__(self, image_path, display_pixmap=None):
         """
         Initializes the draggable image label.
 
@@ -26,23 +61,24 @@ class DraggableImageLabel(QLabel):
             - Stores the scaled pixmap and image path for later use.
 
         How:
-            - Loads the image as a QPixmap and scales it to 100x100 (keeping aspect ratio).
-            - Sets the pixmap, alignment, and enables scaling for the label.
+            - Fetches the image scaled to 100x100 (keeping aspect ratio) from the shared icon cache.
+            - If display_pixmap is given, shows it as-is (already scaled to the label size),
+              so Qt does not have to rescale the image on every paint.
+            - Otherwise shows the 100x100 pixmap and lets the label scale it to fit.
         """
         super().__init__()
-        pixmap = QPixmap(image_path)
-        pixmap = pixmap.scaled(
-            100,
-            100,
-            Qt.KeepAspectRatio
-        )
+        pixmap = load_icon_pixmap(image_path, 100, 100)
         self.original_pixmap = pixmap  # Store the original scaled pixmap
         self.target_size = 100  # Target size for drag preview and display
         self.image_path = image_path  # Store the image path
+        self._png_data = None  # PNG encoding of original_pixmap, built on the first drag
 
-        self.setPixmap(pixmap)  # Set image and scale it
         self.setAlignment(Qt.AlignCenter)  # Center align the image
-        self.setScaledContents(True)  # Enable scaling of the image to fit label
+        if display_pixmap is not None:
+            self.setPixmap(display_pixmap)  # Already at display size, no per-paint scaling
+        else:
+            self.setPixmap(pixmap)
+            self.setScaledContents(True)  # Enable scaling of the image to fit label
 
     def create_bordered_pixmap(self, pixmap: QPixmap) -> QPixmap:
         """
@@ -80,6 +116,22 @@ class DraggableImageLabel(QLabel):
 
         return bordered
 
+    def png_data(self):
+        """
+        Returns the 100x100 image encoded as PNG, encoding it only on the first drag.
+
+        How:
+            - Saves original_pixmap into a QByteArray through a QBuffer and keeps the result;
+              QByteArray is implicitly shared, so later drags hand out the same bytes without copying.
+        """
+        if self._png_data is None:
+            byte_array = QByteArray()
+            buffer = QBuffer(byte_array)
+            buffer.open(QIODevice.WriteOnly)
+            self.original_pixmap.save(buffer, "PNG")
+            self._png_data = byte_array
+        return self._png_data
+
     def mousePressEvent(self, event):
         """
         Initiates a drag-and-drop operation with a bordered image preview.
@@ -91,7 +143,8 @@ class DraggableImageLabel(QLabel):
 
         How:
             - Creates a QDrag object and QMimeData for the image.
-            - Saves the image as PNG data in the mime data.
+            - Puts the 100x100 image (not the smaller palette thumbnail) as PNG data in the mime data,
+              encoded once per label by png_data().
             - Adds the base filename as text in the mime data.
             - Sets the drag pixmap to a bordered version of the image.
             - Sets the drag hotspot to the center of the preview.
@@ -102,11 +155,7 @@ class DraggableImageLabel(QLabel):
             mime_data = QMimeData()
 
             # Add image data
-            byte_array = QByteArray()
-            buffer = QBuffer(byte_array)
-            buffer.open(QIODevice.WriteOnly)
-            self.pixmap().save(buffer, "PNG")
-            mime_data.setData("image/png", byte_array)
+            mime_data.setData("image/png", self.png_data())
 
             # Add filename as text
             base_name = os.path.splitext(os.path.basename(self.image_path))[0]
@@ -1,3 +1,4 @@
+import hashlib
 import math
 from PyQt5.QtWidgets import (
     QFrame,
@@ -12,17 +13,216 @@ from PyQt5.QtGui import (
     QGuiApplication, 
     QPixmap,
     QPen, 
+    QBrush,
     QPainterPath, 
     QPainter,
-    QColor
+    QPolygonF,
+    QColor,
+    QStaticText,
+    QTransform,
+    QPixmapCache,
+    QImage
 )
 from PyQt5.QtCore import (
     Qt, 
     QPoint, 
     QRect, 
-    QPointF
+    QRectF,
+    QPointF,
+    QSizeF,
+    QEvent,
+    QSize,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal
 )
 
+CANVAS_BUTTON_QSS = """
+    QWidget#canvasToolbar {
+        background: transparent;
+    }
+    QPushButton#canvasButton {
+        background-color: #e0e0e0;
+        color: #222;
+        border: 1.5px solid;
+        border-radius: 8px;
+        padding: 8px 12px;
+        font-size: 15px;
+        font-weight: 600;
+        letter-spacing: 1px;
+    }
+    QPushButton#canvasButton:hover {
+        background-color: #cccccc;
+        color: #111;
+        border: 1.5px solid #9e9e9e;
+    }
+    QPushButton#canvasButton:pressed, QPushButton#canvasButton:checked {
+        background-color: #757575;
+        color: #fff;
+        border: 1.5px solid #616161;
+    }
+"""
+
+CONTEXT_MENU_QSS = """
+    QMenu {
+        background-color: #232323;
+        color: #fff;
+        border: 1.5px solid #444;
+        border-radius: 10px;
+        padding: 10px 0px;
+        font-size: 15px;
+        min-width: 170px;
+    }
+    QMenu::item {
+        padding: 10px 32px 10px 24px;
+        background: transparent;
+        margin: 2px 0px;
+    }
+    QMenu::item:selected {
+        background-color: #444;
+        color: #fff;
+        border-radius: 6px;
+    }
+    QMenu::separator {
+        height: 1px;
+        background: #444;
+        margin-left: 16px;
+        margin-right: 16px;
+    }
+"""
+
+# Set once on the world widget; every unit container and caption picks its rules up by object name
+CANVAS_WORLD_QSS = """
+    QWidget#canvasWorld, QWidget#unitContainer, QWidget#unitContainer QLabel {
+        background: transparent;
+    }
+    QLabel#unitCaption {
+        font-size: 11px;
+        color: #333;
+    }
+"""
+
+# Downscaled copies pre-rendered for every dropped unit, as fractions of the original size (ascending);
+# a unit is scaled from the smallest level at least as large as its target (see mip_level)
+MIP_LEVELS = (0.25, 0.5, 1.0)
+
+# Units whose source image is larger than this (px, either side) are smooth-scaled on a worker thread
+ASYNC_SCALE_MIN_SIZE = 256
+
+# QPixmapCache budget in KB; holds the decoded drop pixmaps and mip levels shared by every unit dropped from the same icon
+PIXMAP_CACHE_LIMIT_KB = 20 * 1024
+
+# Length (px) of the arrowhead sides drawn at the end of each connection
+ARROW_SIZE = 12
+
+
+# cos and sin of the 30 degrees between the line and each side of the arrowhead
+_COS30 = math.sqrt(3) / 2
+_SIN30 = 0.5
+
+
+def _arrow_offsets(ux, uy):
+    """
+    Returns (dx, dy, dx2, dy2): the arrowhead's back corners relative to its tip, for a line along the unit vector (ux, uy).
+
+    How:
+        - Rotates the direction by -30 and +30 degrees with the angle addition formulas, so no angle
+          (and no atan2, cos or sin call) is needed.
+    """
+    return (
+        ARROW_SIZE * (ux*_COS30 + uy*_SIN30),
+        ARROW_SIZE * (uy*_COS30 - ux*_SIN30),
+        ARROW_SIZE * (ux*_COS30 - uy*_SIN30),
+        ARROW_SIZE * (uy*_COS30 + ux*_SIN30),
+    )
+
+
+# Arrowhead offsets for axis-aligned lines, keyed by the line's (sign dx, sign dy); a zero-length line points right
+AXIS_ARROW_OFFSETS = {
+    (1, 0): _arrow_offsets(1, 0),
+    (-1, 0): _arrow_offsets(-1, 0),
+    (0, 1): _arrow_offsets(0, 1),
+    (0, -1): _arrow_offsets(0, -1),
+    (0, 0): _arrow_offsets(1, 0),
+}
+
+# Connection hit-testing: distance (px) a click may be from a line, and the cell size (px) of the segment grid
+CONNECTION_HIT_THRESHOLD = 8
+CONNECTION_CELL_SIZE = 64
+
+# Padding (px) around a unit's image and caption, and the gap between them
+UNIT_MARGIN = 2
+UNIT_SPACING = 2
+
+# Minimum side (px) of the cached grid tile; small grid spacings repeat several cells per tile
+GRID_TILE_MIN_SIZE = 64
+
+# Padding (px) around a connection's endpoint units that covers its routing detours, pen and arrowhead
+CONNECTION_ROUTE_MARGIN = 72
+
+
+class _ScaleSignals(QObject):
+    """Carries finished background scales back to the GUI thread: (container, generation, image)."""
+    finished = pyqtSignal(object, int, QImage)
+
+
+class _ScaleTask(QRunnable):
+    """Smooth-scales a QImage on a QThreadPool worker (QImage, unlike QPixmap, is safe off the GUI thread)."""
+
+    def __init__(self, signals, container, generation, image, width, height):
+        super().__init__()
+        self.signals = signals
+        self.container = container
+        self.generation = generation
+        self.image = image
+        self.width = width
+        self.height = height
+
+    def run(self):
+        scaled = self.image.scaled(self.width, self.height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.finished.emit(self.container, self.generation, scaled)
+
+
+class UnitImageLabel(QLabel):
+    """
+    QLabel showing a process unit's image with a selection border.
+
+    What it does:
+        - Draws a 2px border around the image: black normally, red while the unit is selected.
+
+    How:
+        - Paints the border with QPainter after the label's own paint, so toggling selection
+          is a flag change and a repaint rather than a stylesheet parse and re-polish.
+    """
+    BORDER_WIDTH = 2
+    BORDER_COLOR = QColor(0, 0, 0)
+    SELECTED_BORDER_COLOR = QColor(255, 0, 0)
+    # Border pens shared by every unit, so a paint does not build a QPen
+    BORDER_PEN = QPen(BORDER_COLOR, BORDER_WIDTH)
+    BORDER_PEN.setJoinStyle(Qt.MiterJoin)
+    SELECTED_BORDER_PEN = QPen(SELECTED_BORDER_COLOR, BORDER_WIDTH)
+    SELECTED_BORDER_PEN.setJoinStyle(Qt.MiterJoin)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._selected = False
+
+    def set_selected(self, selected):
+        """Switches between the normal and selected border, repainting only if it changed."""
+        if selected != self._selected:
+            self._selected = selected
+            self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setPen(self.SELECTED_BORDER_PEN if self._selected else self.BORDER_PEN)
+        painter.setBrush(Qt.NoBrush)
+        half = self.BORDER_WIDTH // 2
+        painter.drawRect(self.rect().adjusted(half, half, -half, -half))
+
 
 class ProcessFlowCanvas(QFrame):
     """
@@ -39,6 +239,17 @@ class ProcessFlowCanvas(QFrame):
         - Handles mouse, keyboard, and drag-and-drop events to provide a rich, interactive experience.
     """
 
+    # Corner names by (row, column): row 0 is the top edge, column 0 the left edge
+    RESIZE_CORNERS = (("top_left", "top_right"), ("bottom_left", "bottom_right"))
+    # Pens and colours shared by every paint, built once instead of per connection per repaint
+    CONNECTION_COLOR = QColor(0, 120, 255)
+    CONNECTION_BRUSH = QBrush(CONNECTION_COLOR)  # setBrush(QColor) would build a QBrush on every call
+    DATA_PEN = QPen(CONNECTION_COLOR, 3)
+    ACTION_PEN = QPen(CONNECTION_COLOR, 3, Qt.DashLine)
+    PREVIEW_PEN = QPen(CONNECTION_COLOR, 2, Qt.DashLine)
+    LABEL_COLOR = QColor(0, 0, 0)
+    GRID_LINE_COLOR = QColor(60, 70, 80).lighter(90)
+
     def __init__(self, parent=None):
         """
         Initializes the Canvas widget.
@@ -53,8 +264,23 @@ class ProcessFlowCanvas(QFrame):
             - Gets the screen size for scaling and layout purposes.
         """
         super().__init__(parent)
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
         self.setAcceptDrops(True)
+        # paintEvent fills its own background, so Qt can skip erasing the canvas before every paint
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         self.setupUI()
+
+        # Every unit container is a child of this transparent widget, so panning moves one widget
+        # instead of every unit. It extends past the canvas on all sides (see _reset_world), and mouse
+        # events pass through it to the canvas. It is created after setupUI(), so it is lowered below
+        # the toolbar buttons, which would otherwise be covered by units panned underneath them.
+        self.world = QWidget(self)
+        self.world.setObjectName("canvasWorld")
+        self.world.setStyleSheet(CANVAS_WORLD_QSS)
+        self.world.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.world.lower()
+        self._reset_world()
         self.images = {}
         self.active_image = None
         self.scaleFactor = 1.0
@@ -70,6 +296,56 @@ class ProcessFlowCanvas(QFrame):
         self.screen_width = screen.width()
         self.screen_height = screen.height()
         self.selected_connection = None  # Track selected connection
+        self._grid_spacing = 20  # Grid spacing in pixels at the current scaleFactor
+        self._grid_tile = None  # (spacing, tile) for the current grid spacing; see grid_tile
+        self._static_layer = None  # Background, grid and connections; see _render_static_layer
+        self._label_cache = {}  # Connection label string -> prepared QStaticText
+        self._context_menu = None  # Unit context menu, built on first right-click
+        self._context_target = None
+        self._connection_menu = None  # Connection context menu, built on first right-click on a line
+        # Spatial index for hit-testing: logical bucket (cx, cy) -> containers overlapping it
+        self._bucket_size = 128
+        self._buckets = {}
+        self._unit_cells = {}
+        # Connection segments by canvas cell (cx, cy), built on demand by connection_at; see _build_segment_grid
+        self._segment_grid = None
+        self._preview_route = None  # (key, route) of the last connection preview; see preview_route
+        # Connections by unit container (both ends), kept in step with self.connections by _link/_unlink_connection
+        self._unit_connections = {}
+        # Unit being dragged or resized whose connections are drawn live over the static layer, not into it
+        self._live_unit = None
+        # Stacking order: container -> rank, higher is drawn on top (new and raised units get the next rank)
+        self._z_rank = {}
+        self._z_counter = 0
+
+        # Bursts of zoom steps (held +/- keys) are multiplied into _pending_zoom and applied once by _apply_zoom,
+        # so scaleFactor, the grid and the unit positions always change together
+        self._pending_zoom = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(50)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+
+        # Fast rescales during zoom are replaced by one smooth pass once zooming settles
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(150)
+        self._smooth_timer.timeout.connect(self._settle_rescale)
+
+        # Mouse moves are applied at most once per frame; only the latest position is kept
+        self._pending_move_pos = None
+        self._pending_buttons = Qt.NoButton
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_move)
+
+        # Smooth scaling of large images runs on the global thread pool; a result is dropped if its
+        # unit has been rescaled again since (its "scale_request" no longer matches the generation)
+        self._pool = QThreadPool.globalInstance()
+        self._scale_generation = 0
+        self._scale_signals = _ScaleSignals(self)
+        self._scale_signals.finished.connect(self._apply_background_scale)
 
     def setupUI(self):
         """
@@ -81,11 +357,17 @@ class ProcessFlowCanvas(QFrame):
 
         How:
             - Uses a vertical layout for the main widget.
-            - Adds a horizontal layout for the buttons.
+            - Adds a toolbar widget with a horizontal layout for the buttons; the toolbar holds the button stylesheet.
             - Calls createButton to make styled buttons and adds them to the layout.
         """
         main_layout = QVBoxLayout(self)
-        button_layout = QHBoxLayout()
+        # The buttons live in a transparent toolbar that carries their shared stylesheet,
+        # so it is parsed once and not overridden by styles applied to the canvas itself
+        toolbar = QWidget(self)
+        toolbar.setObjectName("canvasToolbar")
+        toolbar.setStyleSheet(CANVAS_BUTTON_QSS)
+        button_layout = QHBoxLayout(toolbar)
+        button_layout.setContentsMargins(0, 0, 0, 0)
         self.zoom_in_button = self.createButton("+", self.zoomIn)
         self.zoom_out_button = self.createButton("-", self.zoomOut)
         self.reset_view_button = self.createButton("Reset", self.resetView)
@@ -95,7 +377,7 @@ class ProcessFlowCanvas(QFrame):
         button_layout.addStretch(1)
         self.adjust_button = self.createButton("Adjust", self.toggleAdjustMode)
         button_layout.addWidget(self.adjust_button)
-        main_layout.addLayout(button_layout)
+        main_layout.addWidget(toolbar)
         main_layout.addStretch(1)
 
     def createButton(self, text, handler, checkable=False):
@@ -107,35 +389,14 @@ class ProcessFlowCanvas(QFrame):
             - Optionally makes the button checkable (toggleable) for modes like adjust/pan.
 
         How:
-            - Sets button size, style, and click handler.
-            - Applies a custom stylesheet for appearance.
+            - Sets button size, click handler and object name.
+            - Appearance comes from CANVAS_BUTTON_QSS on the toolbar (selector QPushButton#canvasButton).
         """
         button = QPushButton(text)
         button.setFixedSize(80, 32)
         button.clicked.connect(handler)
         button.setCheckable(checkable)
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #222;
-                border: 1.5px solid;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 15px;
-                font-weight: 600;
-                letter-spacing: 1px;
-            }
-            QPushButton:hover {
-                background-color: #cccccc;
-                color: #111;
-                border: 1.5px solid #9e9e9e;
-            }
-            QPushButton:pressed, QPushButton:checked {
-                background-color: #757575; 
-                color: #fff;
-                border: 1.5px solid #616161;
-            }
-        """)
+        button.setObjectName("canvasButton")
         return button
 
     def dropEvent(self, event):
@@ -149,54 +410,58 @@ class ProcessFlowCanvas(QFrame):
             - Stores all properties for later manipulation and interaction.
 
         How:
-            - Loads the image from the drag event.
+            - Loads the image from the drag event, reusing the pixmap already decoded for an identical drop.
             - Creates a QLabel for the image and another for the text label.
-            - Combines them in a QWidget with a vertical layout.
+            - Places them in a QWidget container (see _layout_unit).
             - Calculates the logical position (independent of zoom/pan).
             - Stores all properties in the images dictionary.
         """
         if event.mimeData().hasFormat("image/png"):
             byte_array = event.mimeData().data("image/png")
-            original_pixmap = QPixmap()
-            original_pixmap.loadFromData(byte_array)
+            pixmap_key = "drop:" + hashlib.md5(bytes(byte_array)).hexdigest()
+            # Decoded pixmaps live in QPixmapCache under pixmap_key, within PIXMAP_CACHE_LIMIT_KB; a unit keeps
+            # its own reference, so eviction only means the next identical drop decodes again
+            original_pixmap = QPixmapCache.find(pixmap_key)
+            if original_pixmap is None or original_pixmap.isNull():
+                original_pixmap = QPixmap()
+                original_pixmap.loadFromData(byte_array)
+                QPixmapCache.insert(pixmap_key, original_pixmap)
 
             # Always get the label from the mime text if available
             base_name = event.mimeData().text() or "Image"
 
+            # The container holds the image and its caption; they are placed by _layout_unit rather
+            # than a QVBoxLayout, so zooming does not invalidate and re-run a layout per unit
+            container = QWidget(self.world)
+            container.setObjectName("unitContainer")
+
             # Create the image label
-            image_label = QLabel()
-            image_label.setPixmap(original_pixmap)
+            image_label = UnitImageLabel(container)
             image_label.setAlignment(Qt.AlignCenter)
-            self.set_image_border_color(image_label, QColor("black"))
+            self.set_image_border_color(image_label, False)
 
             # Create the text label
-            text_label = QLabel(base_name)
+            text_label = QLabel(base_name, container)
             text_label.setAlignment(Qt.AlignCenter)
-            text_label.setStyleSheet("font-size: 11px; color: #333;")
-
-            # Combine image and text in a vertical layout
-            container = QWidget(self)
-            container.setStyleSheet("background: transparent;")
-            v_layout = QVBoxLayout(container)
-            v_layout.setContentsMargins(2, 2, 2, 2)
-            v_layout.setSpacing(2)
-            v_layout.setAlignment(Qt.AlignHCenter)
-            v_layout.addWidget(image_label, alignment=Qt.AlignHCenter)
-            v_layout.addWidget(text_label, alignment=Qt.AlignHCenter)
-
-            # Resize the image
-            scale_factor = 1.0
-            new_width = int(original_pixmap.width() * scale_factor)
-            new_height = int(original_pixmap.height() * scale_factor)
-            scaled_pixmap = original_pixmap.scaled(new_width, new_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            image_label.setPixmap(scaled_pixmap)
-            image_label.setFixedSize(scaled_pixmap.size())
-
-
-            # Resize the container to fit both image and label
-            container.adjustSize()
-            container_width = container.sizeHint().width()
-            container_height = container.sizeHint().height()
+            text_label.setObjectName("unitCaption")
+
+            # A unit's logical size is its image's size; the on-screen pixmap is set by updateImageScaling below,
+            # which reuses a cached scale when the same icon was dropped before at this zoom
+            image_size = original_pixmap.size()
+
+            # The chrome around the image never changes with zoom, so record it once:
+            # (horizontal padding, vertical padding incl. spacing, caption width, caption height)
+            text_label.ensurePolished()  # Apply the caption font from CANVAS_WORLD_QSS before measuring
+            text_hint = text_label.sizeHint()
+            chrome = (
+                2 * UNIT_MARGIN,
+                2 * UNIT_MARGIN + UNIT_SPACING,
+                text_hint.width(),
+                text_hint.height(),
+            )
+            self._layout_unit(container, image_label, text_label, chrome, image_size.width(), image_size.height())
+            container_width = container.width()
+            container_height = container.height()
 
             # Determine logical position (centered at drop) so updateImageScaling can place the container
             drop_pos = event.pos()
@@ -206,16 +471,20 @@ class ProcessFlowCanvas(QFrame):
 
             self.images[container] = {
                 "pixmap": original_pixmap,
-                "size": scaled_pixmap.size(),
+                "pixmap_key": pixmap_key,
+                "size": image_size,
                 "position": logical_position,
                 "resizing_offset": QPoint(),
                 "resizing": False,
                 "resize_corner": None,
-                "original_size": scaled_pixmap.size(),
+                "original_size": image_size,
                 "original_position": logical_position,
                 "image_label": image_label,
                 "text_label": text_label,
+                "chrome": chrome,
             }
+            self._z_counter += 1
+            self._z_rank[container] = self._z_counter
 
             # Use updateImageScaling to position and size this container according to current zoom/pan
             self.updateImageScaling()
@@ -223,17 +492,50 @@ class ProcessFlowCanvas(QFrame):
             self.update()
 
 
-    def set_image_border_color(self, label, color):
+    def mip_pixmap(self, properties, level):
         """
-        Sets the border color for the image label.
+        Returns the unit's pixmap pre-rendered at one of the MIP_LEVELS.
 
         What it does:
-            - Visually highlights an image label, e.g., to indicate selection or focus.
+            - Gives updateImageScaling a source image close to the on-screen size,
+              so zooming only needs a cheap scale for the remaining difference.
+            - Shares the rendered levels between all units dropped from the same icon.
 
         How:
-            - Sets the QLabel's stylesheet to use the specified color for its border.
+            - Looks the level up in QPixmapCache under the unit's pixmap_key (a hash of the dropped PNG data).
+            - On a miss (first use, or evicted under memory pressure) smooth-scales the original pixmap and inserts it.
+            - The 1.0 level is the original pixmap itself.
+        """
+        pixmap = properties["pixmap"]
+        if level == 1.0:
+            return pixmap
+        key = f"{properties['pixmap_key']}:s{level}"
+        scaled = QPixmapCache.find(key)
+        if scaled is None or scaled.isNull():
+            scaled = pixmap.scaled(
+                max(1, int(pixmap.width() * level)),
+                max(1, int(pixmap.height() * level)),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+            QPixmapCache.insert(key, scaled)
+        return scaled
+
+    def mip_level(self, properties, width, height):
         """
-        label.setStyleSheet(f"border: 2px solid {color.name()};")
+        Returns the MIP_LEVELS entry to scale a unit's pixmap from for a width x height target.
+
+        How:
+            - Computes the fraction of the original the target keeps (KeepAspectRatio, so the smaller
+              of the two ratios) and picks the smallest level that is at least that large, so a level is
+              only ever scaled down; targets larger than the original use the original (level 1.0).
+        """
+        pixmap = properties["pixmap"]
+        ratio = min(width / max(1, pixmap.width()), height / max(1, pixmap.height()))
+        for level in MIP_LEVELS:
+            if level >= ratio:
+                return level
+        return 1.0
 
     def dragEnterEvent(self, event):
         """
@@ -280,10 +582,10 @@ class ProcessFlowCanvas(QFrame):
 
         How:
             - If in adjust mode and left mouse button is pressed, starts panning.
-            - Otherwise, checks if an image or connection was clicked.
+            - Otherwise, checks if an image or connection was clicked (images via the bucket index in unit_at).
             - If right-click, shows the context menu for that image or connection.
             - If left-click, selects the image, highlights it, and prepares for move/resize.
-            - If connecting, handles connection logic between units.
+            - If connecting, resolves the end unit with unit_at and handles connection logic between units.
         """
 
         # Check if right-click is on a connection
@@ -295,46 +597,49 @@ class ProcessFlowCanvas(QFrame):
                 return
 
         if self.connecting:
-            for container in self.images:
-                if container.geometry().contains(event.pos()) and container != self.connection_start:
-                    # Simulink-style connection logic 
-                    start_props = self.images[self.connection_start]
-                    end_props = self.images[container]
-
-                    # Default: solid data line
-                    conn_type = 'data'
-                    label = ''
-                    port = 0
-                    total_ports = 1
-
-                    # If block logic for action/dashed lines
-                    if start_props.get("text_label") and "if" in start_props["text_label"].text().lower():
-                        conn_type = 'action'
-                        # Cycle through output ports for If block
-                        port = len([c for c in self.connections if c['start'] == self.connection_start])
-                        total_ports = 3
-                        if port == 0:
-                            label = "if(u1 > 0)"
-                        elif port == 1:
-                            label = "elseif(u2 > 0)"
-                        else:
-                            label = "else"
-
-                    self.connections.append({
-                        'start': self.connection_start,
-                        'end': container,
-                        'type': conn_type,
-                        'label': label,
-                        'port': port,
-                        'total_ports': total_ports
-                    })
-
-                    self.connecting = False
-                    self.connection_start = None
-                    self.connection_preview_pos = None
-                    self.setCursor(Qt.ArrowCursor)
-                    self.update()
-                    return
+            container = self.unit_at(event.pos(), exclude=self.connection_start)
+            if container is not None:
+                # Simulink-style connection logic 
+                start_props = self.images[self.connection_start]
+                end_props = self.images[container]
+
+                # Default: solid data line
+                conn_type = 'data'
+                label = ''
+                port = 0
+                total_ports = 1
+
+                # If block logic for action/dashed lines
+                if start_props.get("text_label") and "if" in start_props["text_label"].text().lower():
+                    conn_type = 'action'
+                    # Cycle through output ports for If block
+                    port = sum(1 for c in self._unit_connections.get(self.connection_start, ()) if c['start'] is self.connection_start)
+                    total_ports = 3
+                    if port == 0:
+                        label = "if(u1 > 0)"
+                    elif port == 1:
+                        label = "elseif(u2 > 0)"
+                    else:
+                        label = "else"
+
+                conn = {
+                    'start': self.connection_start,
+                    'end': container,
+                    'type': conn_type,
+                    'label': label,
+                    'port': port,
+                    'total_ports': total_ports
+                }
+                self.connections.append(conn)
+                self._link_connection(conn)
+                self._invalidate_static_layer()
+
+                self.connecting = False
+                self.connection_start = None
+                self.connection_preview_pos = None
+                self.setCursor(Qt.ArrowCursor)
+                self.update()
+                return
             # If not clicked on another object, cancel connection
             self.connecting = False
             self.connection_start = None
@@ -348,32 +653,127 @@ class ProcessFlowCanvas(QFrame):
             self.last_pan_point = event.pos()
             return
 
-        for container in self.images:
-            if container.geometry().contains(event.pos()):
-                
+        container = self.unit_at(event.pos())
+        if container is not None:
+            # If right-click, show context menu
+            if event.button() == Qt.RightButton:
+                self.showContextMenu(event, container)
+                return
+
+            self.active_image = container
+            self.raise_image(container)
+            properties = self.images[container]
 
-                # If right-click, show context menu
-                if event.button() == Qt.RightButton:
-                    self.showContextMenu(event, container)
-                    return
+            # Adjust the offset for zoom
+            mouse_logical_position = (event.pos() - self.grid_offset) / self.scaleFactor
+            properties["current_image_offset"] = mouse_logical_position - properties["position"]
 
-                self.active_image = container
-                self.raise_image(container)
-                properties = self.images[container]
+            # Set border color to red on select (only on the image label)
+            self.set_image_border_color(properties["image_label"], True)
 
-                # Adjust the offset for zoom
-                mouse_logical_position = (event.pos() - self.grid_offset) / self.scaleFactor
-                properties["current_image_offset"] = mouse_logical_position - properties["position"]
+            # Check if resizing is initiated by clicking on a resize corner
+            if resize_corner := self.get_resize_corner(event.pos(), container):
+                properties["resizing"] = True
+                properties["resize_corner"] = resize_corner
+                # Distance from the grabbed corner, so the corner follows the mouse without jumping
+                properties["resizing_offset"] = event.pos() - self.corner_point(self.unit_rect(container), resize_corner)
+
+    def unit_rect(self, container):
+        """Returns a unit container's geometry in canvas coordinates (containers are positioned inside self.world)."""
+        return container.geometry().translated(self.world.pos())
+
+    def _reset_world(self):
+        """
+        Places the world widget so it covers the canvas plus a margin of one canvas extent on every side.
+
+        How:
+            - The margin lets the world be moved by up to that distance while panning before the units
+              near its edge would be clipped; callers re-place the containers afterwards with _move_containers().
+            - The world is a plain (non-native) child widget: it has no backing store of its own and Qt
+              clips its painting to the canvas, so the margin costs a larger rectangle, not memory, and
+              resizing it on a maximize allocates nothing. A world sized to the canvas would instead need
+              re-anchoring, and every container moved, on each pan step.
+        """
+        margin = max(self.width(), self.height())
+        self.world.setGeometry(-margin, -margin, self.width() + 2 * margin, self.height() + 2 * margin)
+
+    def resizeEvent(self, event):
+        """
+        Keeps the world widget covering the canvas when the canvas is resized.
+
+        How:
+            - Re-places the world with _reset_world() and moves the containers to match.
+            - Restarts the settle timer, so units culled outside the old view are shown and scaled once
+              resizing stops (a burst of resizes, e.g. dragging the window edge, runs one pass).
+        """
+        super().resizeEvent(event)
+        self._invalidate_static_layer()
+        self._reset_world()
+        self._move_containers()
+        self._smooth_timer.start()
+
+    def unit_at(self, pos, exclude=None):
+        """
+        Returns the process unit container under the given canvas position, if any.
+
+        What it does:
+            - Finds the clicked unit without testing every unit on the canvas.
+
+        How:
+            - Maps the position to logical coordinates and looks up its bucket in the spatial index.
+            - Tests only the containers registered in that bucket against their on-screen geometry.
+            - Where units overlap, returns the topmost one (highest z rank), matching what is drawn on screen.
+            - Never returns exclude (used to skip the unit a connection starts from).
+        """
+        logical_x = (pos.x() - self.grid_offset.x()) / self.scaleFactor
+        logical_y = (pos.y() - self.grid_offset.y()) / self.scaleFactor
+        cell = (int(logical_x // self._bucket_size), int(logical_y // self._bucket_size))
+        z_rank = self._z_rank
+        hit = None
+        for container in self._buckets.get(cell, ()):
+            if container is exclude:
+                continue
+            if self.unit_rect(container).contains(pos) and (hit is None or z_rank[container] > z_rank[hit]):
+                hit = container
+        return hit
+
+    def _index_unit(self, container):
+        """
+        Registers a container in every spatial index bucket its footprint covers.
+
+        What it does:
+            - Keeps the bucket index used by unit_at in sync after a unit is dropped, moved or resized.
 
-                # Set border color to red on select (only on the image label)
-                self.set_image_border_color(properties["image_label"], QColor("red"))
+        How:
+            - Removes the container from its previous buckets.
+            - Maps its on-screen geometry to logical coordinates (buckets are stable under pan and zoom)
+              and adds it to each covered bucket.
+        """
+        self._unindex_unit(container)
+        rect = self.unit_rect(container)
+        size = self._bucket_size
+        scale = self.scaleFactor
+        left = int(((rect.left() - self.grid_offset.x()) / scale) // size)
+        right = int(((rect.right() - self.grid_offset.x()) / scale) // size)
+        top = int(((rect.top() - self.grid_offset.y()) / scale) // size)
+        bottom = int(((rect.bottom() - self.grid_offset.y()) / scale) // size)
+        cells = [(cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)]
+        for cell in cells:
+            self._buckets.setdefault(cell, []).append(container)
+        self._unit_cells[container] = cells
+
+    def _unindex_unit(self, container):
+        """
+        Removes a container from the spatial index.
 
-                # Check if resizing is initiated by clicking on a resize corner
-                if resize_corner := self.get_resize_corner(event.pos(), container):
-                    properties["resizing"] = True
-                    properties["resize_corner"] = resize_corner
-                    properties["resizing_offset"] = (event.pos() - properties["position"]) / self.scaleFactor
-                break
+        How:
+            - Drops the container from each bucket it was registered in and deletes empty buckets.
+        """
+        for cell in self._unit_cells.pop(container, ()):
+            bucket = self._buckets[cell]
+            bucket.remove(container)
+            if not bucket:
+                del self._buckets[cell]
 
     def mouseMoveEvent(self, event):
         """
@@ -383,42 +783,140 @@ class ProcessFlowCanvas(QFrame):
             - Moves or resizes the selected image as the mouse moves.
             - Handles panning if adjust mode is active.
             - Updates connection preview line if connecting.
+            - Applies at most one move per 16 ms (~60 per second), however fast Qt delivers events.
+
+        How:
+            - Ignores moves when nothing is being dragged, panned or connected.
+            - Otherwise stores the latest position and buttons and starts the single-shot move timer;
+              _flush_move applies only the most recent position when it fires.
+        """
+        if self.active_image is None and not self.connecting and not self.adjust_mode:
+            return
+        self._pending_move_pos = event.pos()
+        self._pending_buttons = event.buttons()
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _flush_move(self):
+        """
+        Applies the latest mouse move stored by mouseMoveEvent.
 
         How:
-            - If in adjust mode and panning, updates the grid offset and all image positions.
-            - If an image is selected, moves or resizes it based on the mouse position and updates its logical position.
             - If connecting, updates the preview line position.
+            - If in adjust mode and panning, updates the grid offset and moves the world widget holding all containers.
+            - If an image is selected, moves or resizes it based on the mouse position and updates its logical position.
         """
+        pos = self._pending_move_pos
+        if pos is None:
+            return
+        self._pending_move_pos = None
+
         if self.connecting and self.connection_start:
-            self.connection_preview_pos = event.pos()
-            self.update()
+            if pos == self.connection_preview_pos:
+                return
+            # Repaint only where the preview line was and where it is now
+            dirty = self.preview_dirty_rect(self.connection_preview_pos, pos)
+            self.connection_preview_pos = pos
+            self.update(dirty)
             return
 
 
         if self.adjust_mode and self.last_pan_point is not None:
-            delta = event.pos() - self.last_pan_point
-            self.last_pan_point = event.pos()
+            delta = pos - self.last_pan_point
+            self.last_pan_point = pos
             self.grid_offset += delta
-            self.updateImageScaling()  # Move objects with the grid
+            # One widget move shifts every unit; panning never changes on-screen sizes, so no pixmap is rescaled
+            self.world.move(self.world.pos() + delta)
+            self._invalidate_static_layer()
+            if not self.world.geometry().contains(self.rect()):
+                # Panned past the world's margin: recentre it and place the units again
+                self._reset_world()
+                self._move_containers()
+            # Once panning pauses, units that came near the view are shown and scaled (see _do_rescale)
+            self._smooth_timer.start()
             self.update()
             return
 
         if self.active_image is not None:
             properties = self.images[self.active_image]
             if properties["resizing"]:
-                self.resize_image(event.pos(), properties)
+                self.resize_image(pos, properties)
             else:
-                if event.buttons() == Qt.LeftButton:
+                if self._pending_buttons == Qt.LeftButton:
                     # Calculate logical position for movement
-                    mouse_logical_pos = (event.pos() - self.grid_offset) / self.scaleFactor
+                    mouse_logical_pos = (pos - self.grid_offset) / self.scaleFactor
                     new_logical_pos = mouse_logical_pos - properties["current_image_offset"]
                     properties["position"] = new_logical_pos  # Update logical position
 
                     # Calculate new screen position
                     scaled_x = int(new_logical_pos.x() * self.scaleFactor) + self.grid_offset.x()
                     scaled_y = int(new_logical_pos.y() * self.scaleFactor) + self.grid_offset.y()
-                    self.active_image.move(scaled_x, scaled_y)
-                    self.update()
+                    # Repaint only what the unit and its connections covered before and after the move
+                    dirty = self.unit_dirty_rect(self.active_image)
+                    self.active_image.move(QPoint(scaled_x, scaled_y) - self.world.pos())
+                    if self._has_connections(self.active_image):
+                        self._set_live_unit(self.active_image)
+                    self.update(dirty.united(self.unit_dirty_rect(self.active_image)))
+
+    def unit_dirty_rect(self, container):
+        """
+        Returns the canvas area painted for a unit: its geometry plus its connection lines.
+
+        What it does:
+            - Lets a moving unit repaint just the region it affects instead of the whole canvas (grid included).
+
+        How:
+            - Unites the container geometry with connection_bounds() of the unit's connections,
+              looked up in the per-unit connection index rather than by scanning every connection.
+        """
+        dirty = self.unit_rect(container).adjusted(-2, -2, 2, 2)
+        for conn in self._unit_connections.get(container, ()):
+            dirty = dirty.united(self.connection_bounds(conn))
+        return dirty
+
+    def connection_bounds(self, conn):
+        """
+        Returns a rect that is guaranteed to hold everything drawn for a connection.
+
+        What it does:
+            - Gives paintEvent a cheap test for skipping connections outside the repainted area,
+              and gives moves a dirty rect without building the connection's path.
+
+        How:
+            - Returns the bounds cached with the connection's route (see connection_route).
+        """
+        return self.connection_route(conn)[3]
+
+    def route_bounds(self, conn, start_rect, end_rect):
+        """
+        Computes the bounds returned by connection_bounds from the endpoint rects.
+
+        How:
+            - Unites both endpoint geometries and pads them by CONNECTION_ROUTE_MARGIN (the routes
+              detour at most 60px around the units).
+            - Adds the label's text rect when the connection has a label.
+        """
+        margin = CONNECTION_ROUTE_MARGIN
+        bounds = start_rect.united(end_rect).adjusted(-margin, -margin, margin, margin)
+        if conn.get('label'):
+            label_rect = self.fontMetrics().boundingRect(conn['label'])
+            label_rect.translate(start_rect.right() + 10, start_rect.top() + start_rect.height() // 2 - 10)
+            bounds = bounds.united(label_rect.adjusted(-2, -2, 2, 2))
+        return bounds
+
+    def preview_dirty_rect(self, *points):
+        """
+        Returns the area covered by the connection preview line for the given end points.
+
+        How:
+            - Unites the start unit's geometry with each non-None point and pads by CONNECTION_ROUTE_MARGIN.
+        """
+        margin = CONNECTION_ROUTE_MARGIN
+        dirty = self.unit_rect(self.connection_start)
+        for point in points:
+            if point is not None:
+                dirty = dirty.united(QRect(point, point))
+        return dirty.adjusted(-margin, -margin, margin, margin)
 
     def mouseReleaseEvent(self, event):
         """
@@ -432,7 +930,14 @@ class ProcessFlowCanvas(QFrame):
         How:
             - If in adjust mode, ends panning.
             - Otherwise, updates the logical position of the image and resets selection/border color.
+            - After a resize, stores the new logical size and lets _do_rescale apply the final smooth scale.
+            - Hands the unit's connections, drawn live during the drag, back to the static layer.
+            - First applies any mouse move still waiting on the move timer, so the final position is not lost.
         """
+        if self._move_timer.isActive():
+            self._move_timer.stop()
+            self._flush_move()
+
         if self.adjust_mode and event.button() == Qt.LeftButton:
             self.setCursor(Qt.OpenHandCursor)
             self.last_pan_point = None
@@ -440,20 +945,35 @@ class ProcessFlowCanvas(QFrame):
 
         if self.active_image is not None:
             properties = self.images[self.active_image]
-            widget_pos = self.active_image.pos()
+            widget_pos = self.active_image.pos() + self.world.pos()
             # Subtract grid_offset before dividing by scaleFactor to get logical position
             logical_x = (widget_pos.x() - self.grid_offset.x()) / self.scaleFactor
             logical_y = (widget_pos.y() - self.grid_offset.y()) / self.scaleFactor
             logical_position = QPointF(logical_x, logical_y)
             if properties["resizing"]:
                 properties["resizing"] = False
-                properties["size"] = properties["original_size"]
+                final_size = properties["image_label"].size()
+                properties["size"] = QSize(
+                    max(1, round(final_size.width() / self.scaleFactor)),
+                    max(1, round(final_size.height() / self.scaleFactor))
+                )
                 properties["position"] = logical_position
+                # One smooth scale from the original at the final size replaces the fast scales shown during
+                # the drag; going through _do_rescale reuses a cached scale of this size, or smooths large
+                # images off-thread
+                self._do_rescale()
+                if self._has_connections(self.active_image):
+                    self._invalidate_static_layer()
+                    self.update()
             else:
                 properties["position"] = logical_position
+            self._index_unit(self.active_image)
+            if self._live_unit is not None:
+                self._live_unit = None
+                self._invalidate_static_layer()
 
             # Reset the border color to black (only on the image label)
-            self.set_image_border_color(properties["image_label"], QColor("black"))
+            self.set_image_border_color(properties["image_label"], False)
             self.active_image = None
 
     def get_resize_corner(self, pos, image_label):
@@ -465,19 +985,41 @@ class ProcessFlowCanvas(QFrame):
             - Returns the corner name if the mouse is within a corner region.
 
         How:
-            - Uses QRect to define the clickable area for each corner.
+            - Works on the mouse position relative to the unit's top-left corner, so no QRect is built per corner.
+            - Classifies it as left/right and top/bottom band and looks the corner name up in RESIZE_CORNERS.
         """
-        rect = image_label.geometry()
+        rect = self.unit_rect(image_label)
         corner_size = 10
-        if QRect(rect.x(), rect.y(), corner_size, corner_size).contains(pos):
-            return "top_left"
-        elif QRect(rect.x() + rect.width() - corner_size, rect.y(), corner_size, corner_size).contains(pos):
-            return "top_right"
-        elif QRect(rect.x(), rect.y() + rect.height() - corner_size, corner_size, corner_size).contains(pos):
-            return "bottom_left"
-        elif QRect(rect.x() + rect.width() - corner_size, rect.y() + rect.height() - corner_size, corner_size, corner_size).contains(pos):
-            return "bottom_right"
-        return None
+        width = rect.width()
+        height = rect.height()
+        dx = pos.x() - rect.x()
+        dy = pos.y() - rect.y()
+        if not (0 <= dx < width and 0 <= dy < height):
+            return None
+
+        if dx < corner_size:
+            column = 0
+        elif dx >= width - corner_size:
+            column = 1
+        else:
+            return None
+        if dy < corner_size:
+            row = 0
+        elif dy >= height - corner_size:
+            row = 1
+        else:
+            return None
+        return self.RESIZE_CORNERS[row][column]
+
+    def corner_point(self, rect, corner):
+        """Returns the point of rect named by corner ("top_left", "top_right", "bottom_left" or "bottom_right")."""
+        if corner == "top_left":
+            return rect.topLeft()
+        elif corner == "top_right":
+            return rect.topRight()
+        elif corner == "bottom_left":
+            return rect.bottomLeft()
+        return rect.bottomRight()
 
     def resize_image(self, pos, properties):
         """
@@ -488,24 +1030,73 @@ class ProcessFlowCanvas(QFrame):
             - Allows users to resize process units interactively.
 
         How:
-            - Sets the appropriate corner of the image’s rectangle to the new mouse position.
-            - Updates the pixmap to match the new size.
+            - Moves the dragged corner of the container's rectangle to the mouse position, keeping the opposite corner fixed.
+            - Rescales the image label's pixmap to the space left for the image, using Qt.FastTransformation
+              from the smallest mip level covering the target since this runs on every mouse move;
+              on release, _do_rescale applies one smooth scale at the final size.
+            - Resizes the container around the new image with _layout_unit and moves it so the opposite corner stays put.
+            - Repaints only what the unit and its connections covered before and after the resize.
         """
         resize_corner = properties["resize_corner"]
-        rect = self.active_image.geometry()
-        new_rect = rect
+        new_rect = self.unit_rect(self.active_image)
+        corner = pos - properties["resizing_offset"]
 
         if resize_corner == "top_left":
-            new_rect.setTopLeft(pos - properties["resizing_offset"])
+            new_rect.setTopLeft(corner)
         elif resize_corner == "top_right":
-            new_rect.setTopRight(pos - properties["resizing_offset"])
+            new_rect.setTopRight(corner)
         elif resize_corner == "bottom_left":
-            new_rect.setBottomLeft(pos - properties["resizing_offset"])
+            new_rect.setBottomLeft(corner)
         elif resize_corner == "bottom_right":
-            new_rect.setBottomRight(pos - properties["resizing_offset"])
-            self.active_image.setGeometry(new_rect)
-            scaled_pixmap = properties["pixmap"].scaled(new_rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.active_image.setPixmap(scaled_pixmap)
+            new_rect.setBottomRight(corner)
+
+        pad_width, pad_height, text_width, text_height = properties["chrome"]
+        image_width = max(1, new_rect.width() - pad_width)
+        image_height = max(1, new_rect.height() - pad_height - text_height)
+        # Scale down from the smallest pre-rendered mip level that covers the target, not the full-size source
+        level = self.mip_level(properties, image_width, image_height)
+        scaled_pixmap = self.mip_pixmap(properties, level).scaled(
+            image_width, image_height, Qt.KeepAspectRatio, Qt.FastTransformation
+        )
+
+        image_label = properties["image_label"]
+        container = self.active_image
+        dirty = self.unit_dirty_rect(container)
+        image_label.setPixmap(scaled_pixmap)
+        properties["last_scaled"] = None
+        properties["scale_request"] = None
+        self._layout_unit(
+            container, image_label, properties["text_label"], properties["chrome"],
+            scaled_pixmap.width(), scaled_pixmap.height()
+        )
+
+        # Keep the corner opposite the dragged one where it was
+        x = new_rect.right() - container.width() + 1 if resize_corner in ("top_left", "bottom_left") else new_rect.left()
+        y = new_rect.bottom() - container.height() + 1 if resize_corner in ("top_left", "top_right") else new_rect.top()
+        container.move(QPoint(x, y) - self.world.pos())
+        if self._has_connections(container):
+            self._set_live_unit(container)
+        self.update(dirty.united(self.unit_dirty_rect(container)))
+
+    def _layout_unit(self, container, image_label, text_label, chrome, image_width, image_height):
+        """
+        Sizes a unit container and places its image above its centred caption.
+
+        What it does:
+            - Replaces a per-unit QVBoxLayout: the arrangement is fixed, so it is cheaper to set the
+              two label geometries directly than to invalidate and run a layout on every zoom step.
+
+        How:
+            - Makes the container as wide as the wider of image and caption plus padding, and as tall as both plus padding and spacing.
+            - Centres the image and the caption horizontally, UNIT_MARGIN from the top and UNIT_SPACING apart.
+        """
+        pad_width, pad_height, text_width, text_height = chrome
+        width = max(image_width, text_width) + pad_width
+        container.resize(width, image_height + text_height + pad_height)
+        image_label.setGeometry((width - image_width) // 2, UNIT_MARGIN, image_width, image_height)
+        text_label.setGeometry(
+            (width - text_width) // 2, UNIT_MARGIN + image_height + UNIT_SPACING, text_width, text_height
+        )
 
     def keyPressEvent(self, event):
         """
@@ -554,13 +1145,12 @@ class ProcessFlowCanvas(QFrame):
             - Maintains the relative positions and sizes of all elements for a consistent user experience.
 
         How:
-            - Multiplies the current scaleFactor by a fixed ratio (1.1).
-            - Calls updateImageScaling() to recalculate and apply new positions and sizes for all images.
-            - Triggers a repaint of the canvas to reflect the new zoom level.
+            - Multiplies the pending zoom by a fixed ratio (1.1).
+            - Starts the zoom timer; _apply_zoom applies the pending zoom to scaleFactor, the grid and
+              the images once the burst of zoom steps pauses.
         """
-        self.scaleFactor *= 1.1
-        self.update_image_scaling()
-        self.update()
+        self._pending_zoom *= 1.1
+        self._zoom_timer.start()
 
     def zoomOut(self):
         """
@@ -573,13 +1163,29 @@ class ProcessFlowCanvas(QFrame):
             - Ensures that all interactive features (drag, drop, connect, etc.) continue to work seamlessly at the new zoom level.
 
         How:
-            - Divides the current scaleFactor by a fixed ratio (1.1), making all elements smaller.
-            - Calls updateImageScaling() to recalculate the screen positions and sizes of all process units and their labels based on the new scale.
-            - Triggers a repaint of the canvas to visually update the grid, images, and connections at the new zoom level.
+            - Divides the pending zoom by a fixed ratio (1.1), making all elements smaller.
+            - Starts the zoom timer; _apply_zoom applies the pending zoom and recalculates the screen positions
+              and sizes of all process units once the burst of zoom steps pauses.
             - Keeps the logical positions of all objects unchanged, so zooming does not affect the underlying data or connections.
         """
-        self.scaleFactor /= 1.1
-        self.update_image_scaling()
+        self._pending_zoom /= 1.1
+        self._zoom_timer.start()
+
+    def _apply_zoom(self):
+        """
+        Applies the zoom steps accumulated in _pending_zoom after a burst of zoom steps.
+
+        How:
+            - Multiplies scaleFactor by the pending zoom and updates the grid spacing, so until this runs
+              scaleFactor still matches the on-screen units and hit-testing (unit_at) stays consistent.
+            - Calls updateImageScaling() in fast mode, which also invalidates the static layer, then restarts
+              the settle timer so a single smooth pass runs once zooming stops, and repaints.
+        """
+        self.scaleFactor *= self._pending_zoom
+        self._pending_zoom = 1.0
+        self._update_grid_spacing()
+        self.updateImageScaling(smooth=False)
+        self._smooth_timer.start()
         self.update()
 
     def resetView(self):
@@ -599,16 +1205,20 @@ class ProcessFlowCanvas(QFrame):
         if not self.images:
             return
 
-        # Find bounding rect of all objects (in logical coordinates)
-        min_x, min_y = float('inf'), float('inf')
-        max_x, max_y = float('-inf'), float('-inf')
+        # Find bounding rect of all objects (in logical coordinates): gather the edges in one pass,
+        # then reduce each list with the built-in min/max instead of four comparisons per unit
+        lefts, tops, rights, bottoms = [], [], [], []
         for props in self.images.values():
             pos = props["position"]
             size = props["size"]
-            min_x = min(min_x, pos.x())
-            min_y = min(min_y, pos.y())
-            max_x = max(max_x, pos.x() + size.width())
-            max_y = max(max_y, pos.y() + size.height())
+            x = pos.x()
+            y = pos.y()
+            lefts.append(x)
+            tops.append(y)
+            rights.append(x + size.width())
+            bottoms.append(y + size.height())
+        min_x, min_y = min(lefts), min(tops)
+        max_x, max_y = max(rights), max(bottoms)
 
         # Add a margin (in logical units)
         margin = 40
@@ -633,7 +1243,11 @@ class ProcessFlowCanvas(QFrame):
             scale_y = canvas_height / bounding_height
             scale = min(scale_x, scale_y, 1.0)  # Don't zoom in beyond 1.0
 
+        # The fitted scale replaces any zoom steps still waiting for _apply_zoom
+        self._zoom_timer.stop()
+        self._pending_zoom = 1.0
         self.scaleFactor = scale
+        self._update_grid_spacing()
 
         # Center the bounding box in the canvas
         offset_x = int((canvas_width - (bounding_width * scale)) / 2 - min_x * scale)
@@ -644,47 +1258,202 @@ class ProcessFlowCanvas(QFrame):
         self.update()
 
 
-    def updateImageScaling(self):
+    def updateImageScaling(self, smooth=True):
         """
         Updates the size and position of images based on the current scale factor and grid offset.
 
         What it does:
             - Ensures that all process units and their labels are correctly positioned and sized after zooming or panning.
             - Maintains visual consistency and alignment on the canvas.
+            - With smooth=False, uses a cheap nearest-neighbour scale for interactive zoom steps.
+
+        How:
+            - Rescales every image pixmap via _do_rescale().
+            - Moves every container to its screen position via _move_containers().
+            - Rebuilds the spatial index, since the unscaled text labels change each unit's logical footprint.
+            - Disables updates (for the canvas and every unit) while doing so, so the per-unit
+              moves and resizes produce one repaint when updates are re-enabled instead of one each.
+        """
+        self._invalidate_static_layer()
+        updates_were_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._do_rescale(smooth)
+            self._move_containers()
+
+            self._buckets.clear()
+            self._unit_cells.clear()
+            for container in self.images:
+                self._index_unit(container)
+        finally:
+            if updates_were_enabled:
+                self.setUpdatesEnabled(True)
+
+    def _settle_rescale(self):
+        """
+        Runs the smooth pass once zooming or panning settles.
+
+        How:
+            - Calls _do_rescale() with updates disabled, as updateImageScaling does, so the units it
+              rescales and shows are repainted once together rather than one by one.
+        """
+        updates_were_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._do_rescale()
+        finally:
+            if updates_were_enabled:
+                self.setUpdatesEnabled(True)
+
+    def _move_containers(self):
+        """
+        Moves every container to its screen position without touching its pixmap.
+
+        What it does:
+            - Places process units after zoom and reset, and whenever the world widget is re-placed.
 
         How:
-            - Iterates through all images, recalculating their screen positions and sizes from logical coordinates.
-            - Scales the pixmap and updates the QLabel and container widget accordingly.
+            - Reads the scale factor, grid offset and world position once, outside the loop.
+            - Converts each logical position to screen coordinates, relative to the world widget, and calls move() on the container.
         """
+        scale = self.scaleFactor
+        world_pos = self.world.pos()
+        offset_x = self.grid_offset.x() - world_pos.x()
+        offset_y = self.grid_offset.y() - world_pos.y()
         for container, properties in self.images.items():
-            # Logical position and size
-            original_position = properties["position"]
-            original_size = properties["size"]
+            position = properties["position"]
+            container.move(int(position.x() * scale) + offset_x, int(position.y() * scale) + offset_y)
 
-            # Apply scaling and grid offset
-            scaled_x = int(original_position.x() * self.scaleFactor) + self.grid_offset.x()
-            scaled_y = int(original_position.y() * self.scaleFactor) + self.grid_offset.y()
-            scaled_width = int(original_size.width() * self.scaleFactor)
-            scaled_height = int(original_size.height() * self.scaleFactor)
+    def _do_rescale(self, smooth=True):
+        """
+        Rescales every image pixmap to the current scale factor.
 
-            # Scale the image pixmap
-            scaled_pixmap = properties["pixmap"].scaled(
-                scaled_width,
-                scaled_height,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+        What it does:
+            - Produces the on-screen pixmap for each process unit at the current zoom level.
+            - Runs directly for zoom/reset, and from the settle timer (via _settle_rescale) after zooming.
+            - Skips units whose label already shows the requested size at the requested quality.
+            - Hides units far outside the view instead of scaling their pixmaps.
+
+        How:
+            - Culls units whose logical rect misses the view expanded by one canvas extent per side:
+              they are hidden and sized without scaling, and marked "culled" so they are shown and rescaled later.
+            - Compares (width, height, smooth) with the unit's "last_scaled" and leaves it alone on a match
+              (a smooth result also satisfies a fast request).
+            - Reuses smooth scales from QPixmapCache, keyed by the unit's pixmap_key and target size,
+              so returning to a zoom level does not smooth-scale again.
+            - Otherwise smooth-scales from the original pixmap, or for a fast pass picks the smallest
+              pre-rendered mip level that covers the unit's target size (see mip_level) and scales down from it.
+            - For a smooth pass on a large image, shows a fast scale immediately and queues the
+              smooth scale on the thread pool (see _apply_background_scale); small icons stay on the GUI thread.
+            - Updates the QLabel and places it and the caption with _layout_unit, using the
+              chrome recorded at drop time rather than a layout pass.
+        """
+        scale = self.scaleFactor
+        self._scale_generation += 1
+
+        # Logical area of the canvas plus one canvas extent on every side (the world widget's pan margin)
+        margin = max(self.width(), self.height())
+        visible = QRectF(
+            (-self.grid_offset.x() - margin) / scale,
+            (-self.grid_offset.y() - margin) / scale,
+            (self.width() + 2 * margin) / scale,
+            (self.height() + 2 * margin) / scale
+        )
+
+        for container, properties in self.images.items():
+            original_size = properties["size"]
+            scaled_width = int(original_size.width() * scale)
+            scaled_height = int(original_size.height() * scale)
+
+            if not visible.intersects(QRectF(properties["position"], QSizeF(original_size))):
+                # Off-screen: hide the unit and give it its on-screen size (for hit-testing and routing)
+                # without scaling any pixels; it is rescaled when it comes back into view
+                image_size = properties["pixmap"].size().scaled(scaled_width, scaled_height, Qt.KeepAspectRatio)
+                self._layout_unit(
+                    container, properties["image_label"], properties["text_label"], properties["chrome"],
+                    image_size.width(), image_size.height()
+                )
+                container.hide()
+                properties["culled"] = True
+                properties["last_scaled"] = None
+                properties["scale_request"] = None
+                continue
+            if properties.get("culled"):
+                properties["culled"] = False
+                container.show()
+
+            last_scaled = properties.get("last_scaled")
+            if last_scaled in ((scaled_width, scaled_height, True), (scaled_width, scaled_height, smooth)):
+                continue
+
+            cache_key = f"{properties['pixmap_key']}:{scaled_width}x{scaled_height}"
+            scaled_pixmap = QPixmapCache.find(cache_key)
+            if scaled_pixmap is not None and not scaled_pixmap.isNull():
+                is_smooth = True
+                properties["scale_request"] = None
+            else:
+                pixmap = properties["pixmap"]
+                is_smooth = smooth
+                if smooth and max(pixmap.width(), pixmap.height()) > ASYNC_SCALE_MIN_SIZE:
+                    # The worker needs a QImage; convert per task rather than keep a full-size copy per icon
+                    properties["scale_request"] = self._scale_generation
+                    self._pool.start(_ScaleTask(
+                        self._scale_signals,
+                        container,
+                        self._scale_generation,
+                        pixmap.toImage(),
+                        scaled_width,
+                        scaled_height
+                    ))
+                    unit_transform = Qt.FastTransformation
+                    is_smooth = False  # Becomes smooth when the worker's result is applied
+                else:
+                    properties["scale_request"] = None
+                    unit_transform = Qt.SmoothTransformation if smooth else Qt.FastTransformation
 
-            # Update the image label pixmap and size
+                # Smooth (final quality) scales come from the original pixmap; fast ones scale down from
+                # the smallest pre-rendered level covering this unit's target
+                if unit_transform == Qt.SmoothTransformation:
+                    source = properties["pixmap"]
+                else:
+                    source = self.mip_pixmap(properties, self.mip_level(properties, scaled_width, scaled_height))
+                scaled_pixmap = source.scaled(
+                    scaled_width,
+                    scaled_height,
+                    Qt.KeepAspectRatio,
+                    unit_transform
+                )
+                if unit_transform == Qt.SmoothTransformation:
+                    QPixmapCache.insert(cache_key, scaled_pixmap)
+
+            properties["last_scaled"] = (scaled_width, scaled_height, is_smooth)
+
+            # Update the image label pixmap, then size the container and place both labels
             image_label = properties["image_label"]
             image_label.setPixmap(scaled_pixmap)
-            image_label.setFixedSize(scaled_pixmap.size())
+            self._layout_unit(
+                container, image_label, properties["text_label"], properties["chrome"],
+                scaled_pixmap.width(), scaled_pixmap.height()
+            )
 
-            # Adjust the container size to fit both image and text
-            container.adjustSize()
+    def _apply_background_scale(self, container, generation, image):
+        """
+        Shows a smooth scale finished on a worker thread.
 
-            # Move the container to the scaled and offset position
-            container.move(scaled_x, scaled_y)
+        How:
+            - Ignores the result if the unit was deleted or has been rescaled again since the task was queued.
+            - Converts the QImage to a QPixmap on the GUI thread, sets it on the unit's image label
+              and stores it in QPixmapCache for later zooms to the same size.
+        """
+        properties = self.images.get(container)
+        if properties is None or properties.get("scale_request") != generation:
+            return
+        properties["scale_request"] = None
+        pixmap = QPixmap.fromImage(image)
+        width, height, _ = properties["last_scaled"]
+        QPixmapCache.insert(f"{properties['pixmap_key']}:{width}x{height}", pixmap)
+        properties["last_scaled"] = (width, height, True)
+        properties["image_label"].setPixmap(pixmap)
 
     def paintEvent(self, event):
         """
@@ -696,149 +1465,247 @@ class ProcessFlowCanvas(QFrame):
             - Shows a preview line when the user is in the process of connecting units.
 
         How:
-            - Uses QPainter to render the grid and all connection paths.
-            - Applies different styles for data and action connections.
-            - Draws labels and arrowheads at appropriate positions.
-        """
+            - Blits the dirty area from the static layer (background, grid and connections), re-rendering
+              it first with _render_static_layer() if it was invalidated or the canvas was resized.
+              The layer is opaque, so it also stands in for the background Qt no longer erases.
+            - Draws the connections of the unit being dragged or resized, which the layer leaves out.
+            - Draws the frame, then the connection preview line on top.
+        """
+        dirty = event.rect()
+        # The grid and connections only change when units, connections or the view change, so they are
+        # rendered once into the static layer and each paint just blits the dirty part of it
+        if self._static_layer is None or self._static_layer.size() != self.size() * self.devicePixelRatioF():
+            self._render_static_layer()
+        layer_painter = QPainter(self)
+        layer_painter.setClipRect(dirty)
+        layer_painter.drawPixmap(0, 0, self._static_layer)
+        if self._live_unit is not None:
+            self.draw_connections(layer_painter, dirty, self._unit_connections.get(self._live_unit, ()))
+        layer_painter.end()
         super().paintEvent(event)
         painter = QPainter(self)
-        self.drawGrid(painter)
-        for conn in self.connections:
+        painter.setClipRect(dirty)
 
-            start = conn['start']
-            end = conn['end']
-            conn_type = conn.get('type', 'data')
-            label = conn.get('label', '')
+         # Draw preview line if connecting
+        if self.connecting and self.connection_start and self.connection_preview_pos:
+            end_pos = (self.connection_preview_pos.x(), self.connection_preview_pos.y())
+            path, arrow_from = self.preview_route(self.unit_rect(self.connection_start), end_pos)
+            painter.setPen(self.PREVIEW_PEN)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPath(path)
+            self.draw_arrow(painter, arrow_from, end_pos)
+
+    def preview_route(self, start_rect, end_pos):
+        """
+        Returns the (path, arrow_from) of the connection preview line from start_rect to end_pos.
 
-            start_rect = start.geometry()
-            end_rect = end.geometry()
+        What it does:
+            - Routes the preview around the start unit, above or below it when the pointer is behind it.
+            - Reuses the last route while neither the start unit nor the pointer has moved, so repaints
+              triggered by anything else (unit pixmaps, frame updates) do not rebuild the path.
 
-            start_pos = (start_rect.right(), start_rect.top() + start_rect.height() // 2)
-            end_pos = (end_rect.left(), end_rect.top() + end_rect.height() // 2)
+        How:
+            - Keys the cache on the start rect and end position, both in integer canvas coordinates.
+            - Builds the corner points once for every case and turns them into the path with a single
+              addPolygon call; the arrow starts from the last corner before end_pos.
+        """
+        key = (start_rect.getRect(), end_pos)
+        cached = self._preview_route
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-            offset = 24
-            gap = 60  # Large enough to always clear the blocks
+        start_pos = (start_rect.right(), start_rect.top() + start_rect.height() // 2)
+        offset = 34
+        gap = 60
+        points = [start_pos]
+        p1 = (start_pos[0] + offset, start_pos[1])
+        if start_pos[0] < end_pos[0] - offset:
+            p2 = (end_pos[0] - offset, end_pos[1])
+            if abs(start_pos[1] - end_pos[1]) < 2 * offset:
+                points += [p1, (p1[0], end_pos[1]), p2]
+            else:
+                mid_y = (start_pos[1] + end_pos[1]) // 2
+                points += [p1, (p1[0], mid_y), (p2[0], mid_y), p2]
+        else:
+            # Loop back above the start unit when the pointer is above it, below it when the pointer
+            # is below, and otherwise just above the start port
+            if start_rect.top() > end_pos[1] + gap:
+                detour_y = start_rect.top() - gap
+            elif start_rect.bottom() + gap < end_pos[1]:
+                detour_y = start_rect.bottom() + gap
+            else:
+                detour_y = start_pos[1] - gap
+            back_x = end_pos[0] - gap
+            points += [p1, (p1[0], detour_y), (back_x, detour_y), (back_x, end_pos[1]), (end_pos[0] - offset, end_pos[1])]
+        points.append(end_pos)
+        path = QPainterPath()
+        path.addPolygon(QPolygonF([QPointF(*point) for point in points]))  # Open polyline, as in connection_route
+        arrow_from = points[-2]
+        route = (path, arrow_from)
+        self._preview_route = (key, route)
+        return route
 
-            path = QPainterPath()
-            path.moveTo(*start_pos)
+    def _render_static_layer(self):
+        """
+        Renders the background, grid and every connection into the static layer pixmap.
 
-            if start_pos[0] < end_pos[0] - offset:
-                # Standard left-to-right
-                p1 = (start_pos[0] + offset, start_pos[1])
-                p2 = (end_pos[0] - offset, end_pos[1])
-                if abs(start_pos[1] - end_pos[1]) < 2 * offset:
-                    path.lineTo(*p1)
-                    path.lineTo(p1[0], end_pos[1])
-                    path.lineTo(*p2)
-                else:
-                    mid_y = (start_pos[1] + end_pos[1]) // 2
-                    path.lineTo(*p1)
-                    path.lineTo(p1[0], mid_y)
-                    path.lineTo(p2[0], mid_y)
-                    path.lineTo(*p2)
-                path.lineTo(*end_pos)
-                arrow_from = p2
+        What it does:
+            - Lets paintEvent blit unchanging content instead of redrawing it, so preview-line moves
+              and unit drags without connections cost one pixmap blit.
+
+        How:
+            - Creates a canvas-sized pixmap at the device pixel ratio and fills it with the palette's window brush.
+            - Draws the grid with drawGrid() and the connections with draw_connections(), leaving out
+              the connections of the unit being dragged or resized (paintEvent draws those live).
+        """
+        ratio = self.devicePixelRatioF()
+        layer = QPixmap(self.size() * ratio)
+        layer.setDevicePixelRatio(ratio)
+        rect = self.rect()
+        painter = QPainter(layer)
+        painter.setFont(self.font())  # A pixmap painter starts with the application font, not the canvas's
+        painter.fillRect(rect, self.palette().window())
+        self.drawGrid(painter, rect)
+        live = self._live_unit
+        if live is None:
+            self.draw_connections(painter, rect)
+        else:
+            self.draw_connections(painter, rect, [
+                conn for conn in self.connections if conn['start'] is not live and conn['end'] is not live
+            ])
+        painter.end()
+        self._static_layer = layer
+
+    def _invalidate_static_layer(self):
+        """
+        Drops the static layer so the next paint re-renders it; call after anything it shows changes.
+
+        How:
+            - Also drops the connection segment grid, since every change to a connection's route
+              (add, delete, unit move or resize, pan, zoom) changes what the layer shows.
+        """
+        self._static_layer = None
+        self._segment_grid = None
+
+    def _set_live_unit(self, container):
+        """
+        Draws a moving unit's connections live instead of from the static layer.
+
+        What it does:
+            - Lets a unit with connections be dragged or resized without re-rendering the whole layer
+              (grid and every other connection) on each step.
+
+        How:
+            - On the first step, re-renders the layer once without the unit's connections; later steps keep it.
+            - Drops the connection segment grid on every step, since the unit's routes have moved.
+            - mouseReleaseEvent clears the live unit and invalidates the layer, so the connections go back into it.
+        """
+        if self._live_unit is not container:
+            self._live_unit = container
+            self._invalidate_static_layer()
+        self._segment_grid = None
+
+    def _has_connections(self, container):
+        """Returns True if any connection starts or ends at the given unit container."""
+        return bool(self._unit_connections.get(container))
+
+    def _link_connection(self, conn):
+        """Adds a connection just appended to self.connections to the per-unit connection index."""
+        for unit in {conn['start'], conn['end']}:
+            self._unit_connections.setdefault(unit, []).append(conn)
+
+    def _unlink_connection(self, conn):
+        """Removes a connection from self.connections and from the per-unit connection index."""
+        self.connections.remove(conn)
+        for unit in {conn['start'], conn['end']}:
+            unit_connections = self._unit_connections[unit]
+            unit_connections.remove(conn)
+            if not unit_connections:
+                del self._unit_connections[unit]
+
+    def draw_connections(self, painter, rect, connections=None):
+        """
+        Draws every connection (or the given ones) whose bounds intersect rect: lines, arrowheads and labels.
+
+        How:
+            - Takes each connection's path and arrowhead from connection_route(), which caches them.
+            - Merges the paths into one data path, one dashed action path and one arrowhead path,
+              so each is stroked with a single drawPath call.
+            - Keeps antialiasing off for the axis-aligned line paths and turns it on only for the arrowheads.
+            - Draws labels next to the start of their connection from cached QStaticText (see label_text).
+        """
+        # Gather the visible connections into one path per line style plus one for all arrowheads,
+        # so the pens are set up and the strokes issued once per style rather than per connection
+        data_path = QPainterPath()
+        action_path = QPainterPath()
+        arrow_path = QPainterPath()
+        arrow_path.setFillRule(Qt.WindingFill)  # Coinciding arrowheads must not cancel out
+        labels = []
+        for conn in self.connections if connections is None else connections:
+            path, points, arrow, bounds = self.connection_route(conn)
+            if not bounds.intersects(rect):
+                continue
+
+            if conn.get('type', 'data') == 'action':
+                action_path.addPath(path)
             else:
-                # Loopback or feedback
-                # Always go above both blocks if possible
-                top = min(start_rect.top(), end_rect.top())
-                p1 = (start_pos[0] + offset, start_pos[1])
-                p2 = (p1[0], top - gap)
-                p3 = (end_rect.left() - gap, p2[1])
-                p4 = (p3[0], end_pos[1])
-                p5 = (end_pos[0] - offset, end_pos[1])
-                path.lineTo(*p1)
-                path.lineTo(*p2)
-                path.lineTo(*p3)
-                path.lineTo(*p4)
-                path.lineTo(*p5)
-                path.lineTo(*end_pos)
-                arrow_from = p5
-
-            pen = QPen(QColor(0, 120, 255), 3)
-            if conn_type == 'action':
-                pen.setStyle(Qt.DashLine)
-            painter.setPen(pen)
-            painter.setBrush(Qt.NoBrush)
-            painter.drawPath(path)
-            self.draw_arrow(painter, arrow_from, end_pos)
+                data_path.addPath(path)
+            arrow_path.addPolygon(arrow)
+            arrow_path.closeSubpath()
+            label = conn.get('label', '')
             if label:
-                painter.setPen(QColor(0,0,0))
-                painter.drawText(start_pos[0]+10, start_pos[1]-10, label)
+                labels.append((points[0], label))
+
+        # Connection segments are all horizontal or vertical, so they are drawn without antialiasing;
+        # only the diagonal arrowhead edges benefit from it
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setBrush(Qt.NoBrush)
+        painter.setPen(self.DATA_PEN)
+        painter.drawPath(data_path)
+        painter.setPen(self.ACTION_PEN)
+        painter.drawPath(action_path)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(self.DATA_PEN)
+        painter.setBrush(self.CONNECTION_BRUSH)
+        painter.drawPath(arrow_path)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setPen(self.LABEL_COLOR)
+        ascent = self.fontMetrics().ascent()
+        for start_pos, label in labels:
+            # drawStaticText places the text's top-left corner; the label's baseline sits 10px above the line
+            painter.drawStaticText(QPointF(start_pos[0]+10, start_pos[1]-10-ascent), self.label_text(label))
+
+    def label_text(self, label):
+        """
+        Returns the QStaticText for a connection label, laid out once and reused on every paint.
 
-         # Draw preview line if connecting
-        if self.connecting and self.connection_start and self.connection_preview_pos:
-            start_rect = self.connection_start.geometry()
-            start_pos = (start_rect.right(), start_rect.top() + start_rect.height() // 2)
-            end_pos = (self.connection_preview_pos.x(), self.connection_preview_pos.y())
-            offset = 34
-            gap = 60
-            path = QPainterPath()
-            path.moveTo(*start_pos)
-            if start_pos[0] < end_pos[0] - offset:
-                p1 = (start_pos[0] + offset, start_pos[1])
-                p2 = (end_pos[0] - offset, end_pos[1])
-                if abs(start_pos[1] - end_pos[1]) < 2 * offset:
-                    path.lineTo(*p1)
-                    path.lineTo(p1[0], end_pos[1])
-                    path.lineTo(*p2)
-                else:
-                    mid_y = (start_pos[1] + end_pos[1]) // 2
-                    path.lineTo(*p1)
-                    path.lineTo(p1[0], mid_y)
-                    path.lineTo(p2[0], mid_y)
-                    path.lineTo(*p2)
-                path.lineTo(*end_pos)
-                arrow_from = p2
-            else:
-                above = start_rect.top() > end_pos[1] + gap
-                below = start_rect.bottom() + gap < end_pos[1]
-                if above:
-                    p1 = (start_pos[0] + offset, start_pos[1])
-                    p2 = (p1[0], start_rect.top() - gap)
-                    p3 = (end_pos[0] - gap, p2[1])
-                    p4 = (p3[0], end_pos[1])
-                    p5 = (end_pos[0] - offset, end_pos[1])
-                    path.lineTo(*p1)
-                    path.lineTo(*p2)
-                    path.lineTo(*p3)
-                    path.lineTo(*p4)
-                    path.lineTo(*p5)
-                    path.lineTo(*end_pos)
-                    arrow_from = p5
-                elif below:
-                    p1 = (start_pos[0] + offset, start_pos[1])
-                    p2 = (p1[0], start_rect.bottom() + gap)
-                    p3 = (end_pos[0] - gap, p2[1])
-                    p4 = (p3[0], end_pos[1])
-                    p5 = (end_pos[0] - offset, end_pos[1])
-                    path.lineTo(*p1)
-                    path.lineTo(*p2)
-                    path.lineTo(*p3)
-                    path.lineTo(*p4)
-                    path.lineTo(*p5)
-                    path.lineTo(*end_pos)
-                    arrow_from = p5
-                else:
-                    p1 = (start_pos[0] + offset, start_pos[1])
-                    p2 = (p1[0], start_pos[1] - gap)
-                    p3 = (end_pos[0] - gap, p2[1])
-                    p4 = (p3[0], end_pos[1])
-                    p5 = (end_pos[0] - offset, end_pos[1])
-                    path.lineTo(*p1)
-                    path.lineTo(*p2)
-                    path.lineTo(*p3)
-                    path.lineTo(*p4)
-                    path.lineTo(*p5)
-                    path.lineTo(*end_pos)
-                    arrow_from = p5
-            pen = QPen(QColor(0, 120, 255), 2, Qt.DashLine)
-            painter.setPen(pen)
-            painter.setBrush(Qt.NoBrush)
-            painter.drawPath(path)
-            self.draw_arrow(painter, arrow_from, end_pos)
+        How:
+            - Caches one QStaticText per label string, prepared for the canvas font; changeEvent clears the cache when the font changes.
+        """
+        static_text = self._label_cache.get(label)
+        if static_text is None:
+            static_text = QStaticText(label)
+            static_text.prepare(QTransform(), self.font())
+            self._label_cache[label] = static_text
+        return static_text
 
-    def drawGrid(self, painter):
+    def changeEvent(self, event):
+        """
+        Drops cached label layouts, connection routes and the static layer when the canvas font changes.
+
+        How:
+            - Routes are dropped too because their cached bounds include the label's text rect
+              (see route_bounds), measured with the old font; their cache key only covers the endpoints.
+            - _invalidate_static_layer() also drops the segment grid built from those routes.
+        """
+        if event.type() == QEvent.FontChange:
+            self._label_cache.clear()
+            for conn in self.connections:
+                conn.pop('_route', None)
+            self._invalidate_static_layer()
+        super().changeEvent(event)
+
+    def drawGrid(self, painter, rect=None):
         """
         Draws the grid lines on the canvas.
 
@@ -847,25 +1714,57 @@ class ProcessFlowCanvas(QFrame):
             - The grid spacing and opacity automatically adjust based on the current zoom level.
 
         How:
-            - Uses QPainter to draw faint vertical and horizontal lines at intervals determined by scaleFactor.
-            - Applies a consistent color and opacity for a subtle, non-intrusive appearance.
+            - Fetches a single grid cell tile for the current spacing (kept in sync with scaleFactor by _update_grid_spacing).
+            - Blits it across rect (the whole canvas by default) with drawTiledPixmap, aligned to the grid offset.
+            - Applies a consistent opacity for a subtle, non-intrusive appearance.
         """
-        grid_color = QColor(60, 70, 80)
+        if rect is None:
+            rect = self.rect()
         grid_opacity = 0.2
-        grid_spacing = int(20 * self.scaleFactor)
+        grid_spacing = self._grid_spacing
         offset = self.grid_offset
+        tile = self.grid_tile(grid_spacing)
 
         painter.save()
-        painter.setPen(grid_color.lighter(90))
         painter.setOpacity(grid_opacity)
+        painter.drawTiledPixmap(
+            rect,
+            tile,
+            QPoint((rect.x() - offset.x()) % grid_spacing, (rect.y() - offset.y()) % grid_spacing)
+        )
+        painter.restore()
 
-        for x in range(offset.x() % grid_spacing, self.width(), grid_spacing):
-            painter.drawLine(x, 0, x, self.height())
+    def _update_grid_spacing(self):
+        """Recomputes the grid spacing after scaleFactor changes (never below 4px, so the grid stays readable)."""
+        self._grid_spacing = max(4, int(20 * self.scaleFactor))
 
-        for y in range(offset.y() % grid_spacing, self.height(), grid_spacing):
-            painter.drawLine(0, y, self.width(), y)
+    def grid_tile(self, grid_spacing):
+        """
+        Returns a square tile holding a whole number of grid cells.
 
-        painter.restore()
+        What it does:
+            - Lets drawGrid paint the whole grid with one tiled blit instead of one drawLine per grid line.
+
+        How:
+            - Repeats the cell until the tile is at least GRID_TILE_MIN_SIZE wide, so zoomed-out grids
+              (spacing down to 4px) are not blitted a few pixels at a time.
+            - Draws one vertical and one horizontal line per cell along its top-left edges.
+            - Keeps only the tile for the current spacing: a zoom step that changes the spacing replaces it,
+              so large tiles (several MB at wide spacings) do not pile up across zoom levels.
+        """
+        if self._grid_tile is not None and self._grid_tile[0] == grid_spacing:
+            return self._grid_tile[1]
+        tile_size = grid_spacing * -(-GRID_TILE_MIN_SIZE // grid_spacing)
+        tile = QPixmap(tile_size, tile_size)
+        tile.fill(Qt.transparent)
+        tile_painter = QPainter(tile)
+        tile_painter.setPen(self.GRID_LINE_COLOR)
+        for line in range(0, tile_size, grid_spacing):
+            tile_painter.drawLine(line, 0, line, tile_size - 1)
+            tile_painter.drawLine(0, line, tile_size - 1, line)
+        tile_painter.end()
+        self._grid_tile = (grid_spacing, tile)
+        return tile
 
     def raise_image(self, image_label):
         """
@@ -876,13 +1775,12 @@ class ProcessFlowCanvas(QFrame):
             - Improves usability by always keeping the active selection on top.
 
         How:
-            - Calls raise_() on the selected image's container widget.
-            - Calls lower() on all other image containers to maintain stacking order.
+            - Calls raise_() on the selected image's container widget; the others keep their relative order.
+            - Gives it the next z rank so unit_at resolves overlaps the same way.
         """
         image_label.raise_()
-        for label in self.images:
-            if label != image_label:
-                label.lower()
+        self._z_counter += 1
+        self._z_rank[image_label] = self._z_counter
 
     def delete_image(self, image_label):
         """
@@ -893,26 +1791,37 @@ class ProcessFlowCanvas(QFrame):
             - Updates the display immediately.
 
         How:
-            - Deletes the widget and removes its entry from the images dictionary.
+            - Deletes the widget and removes its entry from the images dictionary and the spatial index.
+            - Removes the connections to and from the unit, found through the per-unit connection index.
             - Clears the active selection and triggers a repaint.
         """
         if image_label in self.images:
             del self.images[image_label]
+            self._unindex_unit(image_label)
+            for conn in list(self._unit_connections.get(image_label, ())):
+                if conn is self.selected_connection:
+                    self.selected_connection = None
+                self._unlink_connection(conn)
+            self._z_rank.pop(image_label, None)
+            if self._live_unit is image_label:
+                self._live_unit = None
+            self._invalidate_static_layer()
             image_label.deleteLater()
             self.active_image = None
             self.update()
 
-    def set_image_border_color(self, image_label, color):
+    def set_image_border_color(self, image_label, selected):
         """
         Sets the border color for the image label.
 
         What it does:
-            - Used for selection highlighting and visual feedback.
+            - Used for selection highlighting and visual feedback: red when selected, black otherwise.
 
         How:
-            - Sets the QLabel's stylesheet to use the specified color for its border.
+            - Flips the UnitImageLabel's selected flag; the label paints its own border,
+              so no stylesheet is parsed per mouse event.
         """
-        image_label.setStyleSheet(f"border: 2px solid {color.name()}; border-radius: 0px;")
+        image_label.set_selected(selected)
 
     def showContextMenu(self, event, image_label):
         """
@@ -923,50 +1832,41 @@ class ProcessFlowCanvas(QFrame):
             - Uses a custom-styled menu for a modern, visually appealing interface.
 
         How:
-            - Creates a QMenu with relevant actions and separators.
-            - Applies a custom stylesheet for appearance.
+            - Reuses the menu built once by _ensure_context_menu.
+            - Remembers the right-clicked unit as the menu target.
             - Executes the selected action based on user choice.
         """
+        self._ensure_context_menu()
+        self._context_target = image_label
+        # Show the context menu at the calculated position
+        action = self._context_menu.exec_(event.globalPos())
+        if action == self._context_delete_action:
+            self.delete_image(self._context_target)
+        elif action == self._context_connect_action:
+            self.connect_line(self._context_target)
+        self._context_target = None
+
+    def _ensure_context_menu(self):
+        """
+        Builds the unit context menu on first use.
+
+        What it does:
+            - Avoids constructing a QMenu, its actions and parsing its stylesheet on every right-click
+              (the per-click menus were also never freed, as they are parented to the canvas).
+
+        How:
+            - Creates the QMenu with Delete and Connect Line actions and applies CONTEXT_MENU_QSS once.
+        """
+        if self._context_menu is not None:
+            return
         menu = QMenu(self)
-        delete_action = menu.addAction("Delete")
+        self._context_delete_action = menu.addAction("Delete")
         menu.addSeparator()
-        connect_line = menu.addAction("Connect Line")
+        self._context_connect_action = menu.addAction("Connect Line")
 
         # Modern style: dark, rounded, with padding and clear separators
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #232323;
-                color: #fff;
-                border: 1.5px solid #444;
-                border-radius: 10px;
-                padding: 10px 0px;
-                font-size: 15px;
-                min-width: 170px;
-            }
-            QMenu::item {
-                padding: 10px 32px 10px 24px;
-                background: transparent;
-                margin: 2px 0px;
-            }
-            QMenu::item:selected {
-                background-color: #444;
-                color: #fff;
-                border-radius: 6px;
-            }
-            QMenu::separator {
-                height: 1px;
-                background: #444;
-                margin-left: 16px;
-                margin-right: 16px;
-            }
-        """)
-        # Show the context menu at the calculated position
-        action = menu.exec_(event.globalPos())
-        if action == delete_action:
-            self.delete_image(image_label)
-        elif action == connect_line:
-            self.connect_line(image_label)
-       
+        menu.setStyleSheet(CONTEXT_MENU_QSS)
+        self._context_menu = menu
 
     def toggleAdjustMode(self):
         """
@@ -1015,7 +1915,7 @@ class ProcessFlowCanvas(QFrame):
         How:
             - Computes the position of the port based on the widget geometry, side, and port index.
         """
-        rect = widget.geometry()
+        rect = self.unit_rect(widget)
         if side == 'left':
             y = rect.top() + int((rect.height()/(total_ports+1)) * (port_idx+1))
             return rect.left(), y
@@ -1036,22 +1936,35 @@ class ProcessFlowCanvas(QFrame):
             - Consistent arrow style for all connections.
 
         How:
-            - Calculates the angle between two points and draws a filled arrowhead at the end.
+            - Draws the filled arrowhead QPolygonF from arrow_points() with a single drawPolygon call.
         """
-        
-        angle = math.atan2(p2[1]-p1[1], p2[0]-p1[0])
-        arrow_size = 12
-        dx = arrow_size * math.cos(angle - math.pi/6)
-        dy = arrow_size * math.sin(angle - math.pi/6)
-        dx2 = arrow_size * math.cos(angle + math.pi/6)
-        dy2 = arrow_size * math.sin(angle + math.pi/6)
-        points = [
-            QPoint(p2[0], p2[1]),
-            QPoint(int(p2[0] - dx), int(p2[1] - dy)),
-            QPoint(int(p2[0] - dx2), int(p2[1] - dy2)),
-        ]
-        painter.setBrush(QColor(0, 120, 255))
-        painter.drawPolygon(*points)
+        painter.setBrush(self.CONNECTION_BRUSH)
+        painter.drawPolygon(self.arrow_points(p1, p2))
+
+    def arrow_points(self, p1, p2):
+        """
+        Returns the arrowhead for a line ending at p2, as a QPolygonF of its three corners.
+
+        How:
+            - Places the back corners ARROW_SIZE back from p2, 30 degrees either side of the line.
+            - Horizontal and vertical lines take their offsets from AXIS_ARROW_OFFSETS. Every arrow the
+              canvas draws ends one: routed connections and the preview line both finish on a horizontal segment.
+            - Any other direction falls back to rotating the line's unit vector with _arrow_offsets.
+        """
+        step_x = (p2[0] > p1[0]) - (p2[0] < p1[0])
+        step_y = (p2[1] > p1[1]) - (p2[1] < p1[1])
+        if step_x == 0 or step_y == 0:
+            dx, dy, dx2, dy2 = AXIS_ARROW_OFFSETS[(step_x, step_y)]
+        else:
+            line_x = p2[0] - p1[0]
+            line_y = p2[1] - p1[1]
+            length = math.hypot(line_x, line_y)
+            dx, dy, dx2, dy2 = _arrow_offsets(line_x / length, line_y / length)
+        return QPolygonF([
+            QPointF(p2[0], p2[1]),
+            QPointF(int(p2[0] - dx), int(p2[1] - dy)),
+            QPointF(int(p2[0] - dx2), int(p2[1] - dy2)),
+        ])
 
     def connection_at(self, pos):
         """
@@ -1062,38 +1975,91 @@ class ProcessFlowCanvas(QFrame):
             - Supports hit-testing for interactive editing.
 
         How:
-            - Checks if the mouse position is near any connection path or segment.
-        """
-        threshold = 8  # pixels
-        for conn in self.connections:
-            path = self.connection_path(conn)
-            if path and path.contains(QPointF(pos)):
-                return conn
-            # Fallback: check distance to each segment
-            points = [p for p in self.connection_path_points(conn)]
-            for i in range(len(points)-1):
-                if self.point_near_line(pos, points[i], points[i+1], threshold):
-                    return conn
-        return None
+            - Looks up the position's cell in the segment grid (rebuilt by _build_segment_grid after
+              any route change) and tests only the segments registered there.
+            - Where segments of several connections are in range, returns the earliest-added connection.
+        """
+        if self._segment_grid is None:
+            self._segment_grid = self._build_segment_grid()
+        cell = (pos.x() // CONNECTION_CELL_SIZE, pos.y() // CONNECTION_CELL_SIZE)
+        hit = None
+        for order, conn, p1, p2 in self._segment_grid.get(cell, ()):
+            if (hit is None or order < hit[0]) and self.point_near_line(pos, p1, p2, CONNECTION_HIT_THRESHOLD):
+                hit = (order, conn)
+        return hit[1] if hit is not None else None
+
+    def _build_segment_grid(self):
+        """
+        Builds the grid hash connection_at uses to find the segments near a position.
+
+        How:
+            - Pads each segment's bounding box by CONNECTION_HIT_THRESHOLD and registers
+              (order in self.connections, connection, p1, p2) in every CONNECTION_CELL_SIZE cell it covers.
+            - Uses canvas coordinates, so it is only valid until the next _invalidate_static_layer().
+        """
+        size = CONNECTION_CELL_SIZE
+        pad = CONNECTION_HIT_THRESHOLD
+        grid = {}
+        for order, conn in enumerate(self.connections):
+            points = self.connection_route(conn)[1]
+            for p1, p2 in zip(points, points[1:]):
+                left = (min(p1[0], p2[0]) - pad) // size
+                right = (max(p1[0], p2[0]) + pad) // size
+                top = (min(p1[1], p2[1]) - pad) // size
+                bottom = (max(p1[1], p2[1]) + pad) // size
+                entry = (order, conn, p1, p2)
+                for cx in range(left, right + 1):
+                    for cy in range(top, bottom + 1):
+                        grid.setdefault((cx, cy), []).append(entry)
+        return grid
+
+    def connection_route(self, conn):
+        """
+        Returns the cached (path, points, arrow, bounds) drawn for a connection line between two process units.
+
+        What it does:
+            - Computes the route of a connection once and reuses it for painting and hit-testing
+              until one of its units moves or is resized.
+            - Supports both standard (left-to-right, straight or elbow) and loopback (feedback) connections.
+
+        How:
+            - Keys the cache on both endpoint rects (in canvas coordinates), stored in the connection dict
+              under '_route'; any move, resize, pan or zoom changes the key and recomputes the route.
+            - Resolves the endpoint rects once per call and shares them between the key check and,
+              on a miss, the rebuild.
+            - Builds the corner points with connection_path_points(), a QPainterPath through them
+              (added as one open QPolygonF rather than a lineTo call per corner),
+              the arrowhead QPolygonF on the last segment (ready for paintEvent's batched arrow path)
+              and the bounds from route_bounds().
+        """
+        start_rect = self.unit_rect(conn['start'])
+        end_rect = self.unit_rect(conn['end'])
+        key = (start_rect.getRect(), end_rect.getRect())
+        cached = conn.get('_route')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        points = self.connection_path_points(conn, start_rect, end_rect)
+        path = QPainterPath()
+        path.addPolygon(QPolygonF([QPointF(*point) for point in points]))  # Open polyline, one C++ call
+        route = (
+            path,
+            points,
+            self.arrow_points(points[-2], points[-1]),
+            self.route_bounds(conn, start_rect, end_rect)
+        )
+        conn['_route'] = (key, route)
+        return route
 
     def connection_path(self, conn):
         """
         Returns a QPainterPath representing the visual path of a connection line between two process units.
 
         What it does:
-            - Computes the exact path used to visually render a connection line between two units on the canvas.
-            - Used for both drawing the connection in paintEvent and for hit-testing (detecting if the user clicked near a connection).
-            - Supports both standard (left-to-right, straight or elbow) and loopback (feedback) connections, adapting the path shape accordingly.
-            - Ensures that connections visually avoid overlapping units and maintain a clear, readable flowsheet layout.
+            - Gives callers the exact path drawn in paintEvent.
 
         How:
-            - Retrieves the geometry of the start and end widgets (process units) from the connection dictionary.
-            - Determines the appropriate start and end points for the connection, typically at the right edge of the start unit and the left edge of the end unit.
-            - Calculates intermediate control points for the path:
-                - For standard connections (start to the left of end), creates a path with horizontal and vertical segments, using offsets to avoid overlapping units and to create elbow-style lines.
-                - For loopback or feedback connections (start to the right of end), creates a path that loops above the units, with multiple control points to ensure the line does not intersect the units.
-            - Uses QPainterPath to construct the path by moving to the start point and adding line segments through all calculated control points to the end point.
-            - Returns the completed QPainterPath, which can be used for both drawing and hit-testing.
+            - Returns the path from connection_route(), so it is built only when an endpoint has changed.
 
         Parameters:
             conn (dict): A dictionary containing connection information, including 'start' and 'end' widgets, connection 'type', and port information.
@@ -1101,75 +2067,41 @@ class ProcessFlowCanvas(QFrame):
         Returns:
             QPainterPath: The path object representing the connection line between the two units.
         """
-       
+        return self.connection_route(conn)[0]
 
-        start = conn['start']
-        end = conn['end']
-        start_rect = start.geometry()
-        end_rect = end.geometry()
-        start_pos = (start_rect.right(), start_rect.top() + start_rect.height() // 2)
-        end_pos = (end_rect.left(), end_rect.top() + end_rect.height() // 2)
-        offset = 24
-        gap = 60
-        path = QPainterPath()
-        path.moveTo(*start_pos)
-        if start_pos[0] < end_pos[0] - offset:
-            p1 = (start_pos[0] + offset, start_pos[1])
-            p2 = (end_pos[0] - offset, end_pos[1])
-            if abs(start_pos[1] - end_pos[1]) < 2 * offset:
-                path.lineTo(*p1)
-                path.lineTo(p1[0], end_pos[1])
-                path.lineTo(*p2)
-            else:
-                mid_y = (start_pos[1] + end_pos[1]) // 2
-                path.lineTo(*p1)
-                path.lineTo(p1[0], mid_y)
-                path.lineTo(p2[0], mid_y)
-                path.lineTo(*p2)
-            path.lineTo(*end_pos)
-        else:
-            top = min(start_rect.top(), end_rect.top())
-            p1 = (start_pos[0] + offset, start_pos[1])
-            p2 = (p1[0], top - gap)
-            p3 = (end_rect.left() - gap, p2[1])
-            p4 = (p3[0], end_pos[1])
-            p5 = (end_pos[0] - offset, end_pos[1])
-            path.lineTo(*p1)
-            path.lineTo(*p2)
-            path.lineTo(*p3)
-            path.lineTo(*p4)
-            path.lineTo(*p5)
-            path.lineTo(*end_pos)
-        return path
-
-    def connection_path_points(self, conn):
+    def connection_path_points(self, conn, start_rect=None, end_rect=None):
         
         """
         Returns a list of points (tuples) along the connection path.
     
         What it does:
             - Provides the exact coordinates of all key points (corners and endpoints) that make up the visual path of a connection line between two process units.
-            - Used for hit-testing (detecting if the user clicked near a connection) and for precise interaction, such as selecting or editing a connection line.
+            - Is the single definition of the connection route: connection_route() builds the drawn path and arrowhead from these points.
             - Ensures that all segments of the connection path can be checked for proximity to the mouse or other objects, supporting robust user interaction.
     
         How:
-            - Retrieves the geometry of the start and end widgets (process units) from the connection dictionary.
+            - Uses the start and end rects passed in by connection_route, or retrieves the geometry of the start and end widgets (process units) from the connection dictionary.
             - Determines the appropriate start and end points for the connection, typically at the right edge of the start unit and the left edge of the end unit.
             - Calculates all intermediate control points that define the path:
                 - For standard connections (start to the left of end), adds points for horizontal and vertical segments, including elbows if needed.
+                - When both ports are at the same height, returns just the two endpoints (a single straight segment).
                 - For loopback or feedback connections (start to the right of end), adds multiple points to create a looping path above the units, ensuring the line does not intersect the units.
             - Returns a list of all these points (as tuples), in the order they appear along the path, so each segment can be individually checked or drawn.
         """
-        start = conn['start']
-        end = conn['end']
-        start_rect = start.geometry()
-        end_rect = end.geometry()
+        if start_rect is None:
+            start_rect = self.unit_rect(conn['start'])
+        if end_rect is None:
+            end_rect = self.unit_rect(conn['end'])
         start_pos = (start_rect.right(), start_rect.top() + start_rect.height() // 2)
         end_pos = (end_rect.left(), end_rect.top() + end_rect.height() // 2)
         offset = 24
-        gap = 60
+        gap = 60  # Large enough to always clear the blocks
         points = [start_pos]
-        if start_pos[0] < end_pos[0] - offset:
+        if start_pos[0] < end_pos[0] - offset and start_pos[1] == end_pos[1]:
+            # Aligned ports: the elbow would be collinear, so draw one straight segment
+            points.append(end_pos)
+        elif start_pos[0] < end_pos[0] - offset:
+            # Standard left-to-right
             p1 = (start_pos[0] + offset, start_pos[1])
             p2 = (end_pos[0] - offset, end_pos[1])
             if abs(start_pos[1] - end_pos[1]) < 2 * offset:
@@ -1179,6 +2111,7 @@ class ProcessFlowCanvas(QFrame):
                 points += [p1, (p1[0], mid_y), (p2[0], mid_y), p2]
             points.append(end_pos)
         else:
+            # Loopback or feedback: always go above both blocks
             top = min(start_rect.top(), end_rect.top())
             p1 = (start_pos[0] + offset, start_pos[1])
             p2 = (p1[0], top - gap)
@@ -1196,20 +2129,20 @@ class ProcessFlowCanvas(QFrame):
             - Supports accurate selection of connection lines for editing.
 
         How:
-            - Calculates the perpendicular distance from pt to the line segment and compares to threshold.
+            - Projects pt onto the segment, clamped to its ends, and compares the squared distance
+              to the squared threshold (no square root per test).
         """
-        
         x0, y0 = pt.x(), pt.y()
         x1, y1 = p1
         x2, y2 = p2
         dx = x2 - x1
         dy = y2 - y1
-        if dx == dy == 0:
-            return math.hypot(x0 - x1, y0 - y1) <= threshold
-        t = max(0, min(1, ((x0-x1)*dx + (y0-y1)*dy) / (dx*dx + dy*dy)))
-        proj_x = x1 + t*dx
-        proj_y = y1 + t*dy
-        return math.hypot(x0 - proj_x, y0 - proj_y) <= threshold
+        length_sq = dx*dx + dy*dy
+        if length_sq:
+            t = max(0, min(1, ((x0-x1)*dx + (y0-y1)*dy) / length_sq))
+            x1 += t*dx
+            y1 += t*dy
+        return (x0 - x1)**2 + (y0 - y1)**2 <= threshold*threshold
 
     def showConnectionContextMenu(self, event):
         """
@@ -1220,35 +2153,28 @@ class ProcessFlowCanvas(QFrame):
             - Modern, styled menu for consistency with unit context menus.
 
         How:
-            - Creates a QMenu with a Delete Line action.
+            - Reuses the menu built once by _ensure_connection_menu.
             - Shows the menu at the mouse's global position.
             - Removes the connection if Delete Line is selected.
         """
-        menu = QMenu(self)
-        delete_action = menu.addAction("Delete Line")
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #232323;
-                color: #fff;
-                border: 1.5px solid #444;
-                border-radius: 10px;
-                padding: 10px 0px;
-                font-size: 15px;
-                min-width: 170px;
-            }
-            QMenu::item {
-                padding: 10px 32px 10px 24px;
-                background: transparent;
-                margin: 2px 0px;
-            }
-            QMenu::item:selected {
-                background-color: #444;
-                color: #fff;
-                border-radius: 6px;
-            }
-        """)
-        action = menu.exec_(event.globalPos())
-        if action == delete_action and self.selected_connection:
-            self.connections.remove(self.selected_connection)
+        self._ensure_connection_menu()
+        action = self._connection_menu.exec_(event.globalPos())
+        if action == self._connection_delete_action and self.selected_connection:
+            self._unlink_connection(self.selected_connection)
             self.selected_connection = None
-            self.update()
\ No newline at end of file
+            self._invalidate_static_layer()
+            self.update()
+
+    def _ensure_connection_menu(self):
+        """
+        Builds the connection context menu on first use, like _ensure_context_menu does for units.
+
+        How:
+            - Creates the QMenu with a Delete Line action and applies CONTEXT_MENU_QSS once.
+        """
+        if self._connection_menu is not None:
+            return
+        menu = QMenu(self)
+        self._connection_delete_action = menu.addAction("Delete Line")
+        menu.setStyleSheet(CONTEXT_MENU_QSS)
+        self._connection_menu = menu